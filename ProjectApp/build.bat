@@ -66,6 +66,7 @@ pyinstaller --onefile --windowed --clean --noconfirm ^
     --hidden-import=matplotlib ^
     --hidden-import=PyQt6 ^
     --hidden-import=matplotlib.backends.backend_qt5agg ^
+    --paths=.. ^
     GanttAnalysisApp.py
 
 if %errorlevel% equ 0 (
@@ -88,6 +89,7 @@ pyinstaller --onedir --windowed --clean --noconfirm ^
     --hidden-import=matplotlib ^
     --hidden-import=PyQt6 ^
     --hidden-import=matplotlib.backends.backend_qt5agg ^
+    --paths=.. ^
     GanttAnalysisApp.py
 
 if %errorlevel% equ 0 (
@@ -114,6 +116,7 @@ pyinstaller --onefile --windowed --clean --noconfirm ^
     --hidden-import=matplotlib ^
     --hidden-import=PyQt6 ^
     --hidden-import=matplotlib.backends.backend_qt5agg ^
+    --paths=.. ^
     GanttAnalysisApp.py
 
 echo 2/2: Building directory...
@@ -125,6 +128,7 @@ pyinstaller --onedir --windowed --clean --noconfirm ^
     --hidden-import=matplotlib ^
     --hidden-import=PyQt6 ^
     --hidden-import=matplotlib.backends.backend_qt5agg ^
+    --paths=.. ^
     GanttAnalysisApp.py
 
 echo.
@@ -72,6 +72,7 @@ case $choice in
             --hidden-import=matplotlib \
             --hidden-import=PyQt6 \
             --hidden-import=matplotlib.backends.backend_qt5agg \
+            --paths=.. \
             GanttAnalysisApp.py
         
         if [ $? -eq 0 ]; then
@@ -94,6 +95,7 @@ case $choice in
             --hidden-import=matplotlib \
             --hidden-import=PyQt6 \
             --hidden-import=matplotlib.backends.backend_qt5agg \
+            --paths=.. \
             GanttAnalysisApp.py
         
         if [ $? -eq 0 ]; then
@@ -120,6 +122,7 @@ case $choice in
             --hidden-import=matplotlib \
             --hidden-import=PyQt6 \
             --hidden-import=matplotlib.backends.backend_qt5agg \
+            --paths=.. \
             GanttAnalysisApp.py
         
         echo "2/2: Building directory..."
@@ -131,6 +134,7 @@ case $choice in
             --hidden-import=matplotlib \
             --hidden-import=PyQt6 \
             --hidden-import=matplotlib.backends.backend_qt5agg \
+            --paths=.. \
             GanttAnalysisApp.py
         
         echo
@@ -9,6 +9,9 @@ import subprocess
 import shutil
 from pathlib import Path
 
+# Cache font dan style matplotlib yang ikut dibundel ke folder mpl_config (dibuat ulang tiap build)
+MPL_CONFIG_BUILD_DIR = os.path.join('build', 'mpl_config')
+
 def check_pyinstaller():
     """Cek apakah PyInstaller sudah terinstall"""
     try:
@@ -30,8 +33,22 @@ def install_pyinstaller():
         print("✗ Gagal menginstall PyInstaller")
         return False
 
-def create_spec_file():
-    """Membuat file .spec untuk konfigurasi PyInstaller"""
+def prepare_mpl_config():
+    """Buat cache font dan style tema matplotlib agar grafik pertama tidak membangun ulang cache"""
+    # gantt_mplconfig berada di folder induk, sama seperti gantt_core
+    sys.path.insert(0, os.path.dirname(os.path.abspath('.')))
+    from gantt_mplconfig import build_mpl_config
+    
+    build_mpl_config(MPL_CONFIG_BUILD_DIR)
+    print(f"✓ Cache font dan style matplotlib dibuat di {MPL_CONFIG_BUILD_DIR}")
+
+def create_spec_file(excludes=None, onedir=False):
+    """Membuat file .spec untuk konfigurasi PyInstaller
+
+    excludes: modul yang tidak ikut dibundel (lihat build_profile.compute_excludes)
+    onedir: bundle berupa folder sehingga tidak ada ekstraksi ke folder temp tiap kali dijalankan
+    """
+    excludes_list = ''.join(f"    {name!r},\n" for name in (excludes or []))
     spec_content = '''# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
@@ -49,27 +66,33 @@ hiddenimports = [
     'PyQt6.QtCore',
     'PyQt6.QtGui',
     'datetime',
-    'sys'
+    'sys',
+    'gantt_core'
 ]
 
 # Data files yang perlu disertakan (jika ada)
 datas = [
+    ('build/mpl_config', 'mpl_config'),   # Cache font dan style matplotlib (prepare_mpl_config)
     # Contoh: ('path/to/data', 'data_folder_in_exe'),
 ]
 
 # Binary files yang perlu disertakan
 binaries = []
 
+# Modul yang tidak ikut dibundel
+excludes = [
+''' + excludes_list + ''']
+
 a = Analysis(
     ['GanttAnalysisApp.py'],           # Script utama
-    pathex=[],
+    pathex=['..'],                     # Folder berisi modul inti gantt_core.py
     binaries=binaries,
     datas=datas,
     hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -77,7 +100,41 @@ a = Analysis(
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+'''
+    if onedir:
+        spec_content += '''
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,                # Binary dan data dikumpulkan oleh COLLECT
+    name='GanttAnalysisApp',              # Nama executable
+    debug=False,                          # Set True untuk debugging
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,                            # Kompresi UPX (optional)
+    console=False,                       # Set True jika ingin console window
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon='icon.ico'  # Uncomment dan sesuaikan jika ada icon
+)
 
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='GanttAnalysisApp',              # Folder dist/GanttAnalysisApp
+)
+'''
+    else:
+        spec_content += '''
 exe = EXE(
     pyz,
     a.scripts,
@@ -110,6 +167,7 @@ exe = EXE(
 def build_application():
     """Build aplikasi menggunakan PyInstaller"""
     print("Memulai proses build...")
+    prepare_mpl_config()
     
     try:
         # Build menggunakan file .spec
@@ -130,6 +188,7 @@ def build_application():
 def build_onefile():
     """Build aplikasi sebagai single file executable"""
     print("Memulai proses build (single file)...")
+    prepare_mpl_config()
     
     try:
         cmd = [
@@ -140,12 +199,13 @@ def build_onefile():
             '--noconfirm',                  # Tidak perlu konfirmasi
             '--name=GanttAnalysisApp',      # Nama executable
             # '--icon=icon.ico',            # Uncomment jika ada icon
-            '--add-data=;.',                # Tambahkan data files jika perlu
+            f'--add-data={MPL_CONFIG_BUILD_DIR}{os.pathsep}mpl_config',  # Cache font dan style matplotlib
             '--hidden-import=pandas',
             '--hidden-import=numpy', 
             '--hidden-import=matplotlib',
             '--hidden-import=PyQt6',
             '--hidden-import=matplotlib.backends.backend_qt5agg',
+            '--paths=..',                    # Folder berisi modul inti gantt_core.py
             'GanttAnalysisApp.py'
         ]
         
@@ -160,6 +220,7 @@ def build_onefile():
 def build_onedir():
     """Build aplikasi sebagai directory dengan dependencies"""
     print("Memulai proses build (directory)...")
+    prepare_mpl_config()
     
     try:
         cmd = [
@@ -170,11 +231,13 @@ def build_onedir():
             '--noconfirm',                  # Tidak perlu konfirmasi
             '--name=GanttAnalysisApp',      # Nama executable
             # '--icon=icon.ico',            # Uncomment jika ada icon
+            f'--add-data={MPL_CONFIG_BUILD_DIR}{os.pathsep}mpl_config',  # Cache font dan style matplotlib
             '--hidden-import=pandas',
             '--hidden-import=numpy',
             '--hidden-import=matplotlib',
             '--hidden-import=PyQt6',
             '--hidden-import=matplotlib.backends.backend_qt5agg',
+            '--paths=..',                    # Folder berisi modul inti gantt_core.py
             'GanttAnalysisApp.py'
         ]
         
@@ -204,6 +267,34 @@ def cleanup():
     #     os.remove('GanttAnalysisApp.spec')
     #     print("✓ File .spec dihapus")
 
+def build_optimized(onedir):
+    """Build dengan .spec yang excludes-nya dihitung dari modul runtime, lalu tulis laporan"""
+    from build_profile import collect_runtime_modules, compute_excludes, write_build_report
+    
+    try:
+        runtime_modules = collect_runtime_modules()
+    except (RuntimeError, subprocess.SubprocessError) as e:
+        print(f"✗ {e}")
+        return False
+    excludes = compute_excludes(runtime_modules)
+    print(f"✓ {len(runtime_modules)} modul dipakai saat runtime, {len(excludes)} modul di-exclude")
+    
+    create_spec_file(excludes, onedir)
+    if not build_application():
+        return False
+    write_build_report(runtime_modules, excludes, onedir)
+    return True
+
+def benchmark_startup():
+    """Ukur waktu startup versi source dan executable, False jika melebihi anggaran"""
+    from startup_bench import run_benchmark, find_frozen_executable
+    
+    try:
+        return run_benchmark(find_frozen_executable())
+    except RuntimeError as e:
+        print(f"✗ Benchmark startup gagal: {e}")
+        return False
+
 def check_requirements():
     """Cek apakah semua dependencies sudah terinstall"""
     required_packages = [
@@ -257,20 +348,25 @@ def main():
     print("   2. Directory (folder dengan dependencies)")
     print("   3. Custom (.spec file)")
     print("   4. Cleanup build files")
+    print("   5. Benchmark startup saja")
+    print("   6. Optimized (.spec dengan excludes dari modul runtime + laporan ukuran)")
     
-    choice = input("\nPilihan (1-4): ").strip()
+    choice = input("\nPilihan (1-6): ").strip()
+    built = False
     
     if choice == '1':
         print("\n4. Building single file executable...")
         if build_onefile():
             print("\n✓ Executable berhasil dibuat di folder 'dist'!")
             print("  File: dist/GanttAnalysisApp.exe")
+            built = True
     
     elif choice == '2':
         print("\n4. Building directory executable...")
         if build_onedir():
             print("\n✓ Aplikasi berhasil dibuat di folder 'dist'!")
             print("  Jalankan: dist/GanttAnalysisApp/GanttAnalysisApp.exe")
+            built = True
     
     elif choice == '3':
         print("\n4. Membuat custom .spec file...")
@@ -278,13 +374,32 @@ def main():
         print("\n5. Building dengan .spec file...")
         if build_application():
             print("\n✓ Aplikasi berhasil dibuat di folder 'dist'!")
+            built = True
     
     elif choice == '4':
         cleanup()
         print("\n✓ Cleanup selesai!")
     
+    elif choice == '5':
+        print("\n4. Benchmark startup...")
+        if not benchmark_startup():
+            sys.exit(1)
+    
+    elif choice == '6':
+        onedir = input("   Mode one-dir (tanpa ekstraksi temp)? (y/n): ").strip().lower() == 'y'
+        print("\n4. Merekam modul runtime dan building dengan .spec teroptimasi...")
+        if build_optimized(onedir):
+            print("\n✓ Aplikasi berhasil dibuat di folder 'dist'!")
+            built = True
+    
     else:
         print("✗ Pilihan tidak valid!")
+    
+    # Build dianggap gagal jika waktu startup melebihi anggaran (GANTT_STARTUP_BUDGET)
+    if built:
+        print("\n6. Benchmark startup...")
+        if not benchmark_startup():
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
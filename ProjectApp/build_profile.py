@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Profil build PyInstaller yang dioptimalkan untuk ukuran bundle dan waktu startup
+
+Daftar excludes dihitung dari modul yang benar-benar diimpor aplikasi saat runtime:
+GanttAnalysisApp dijalankan (platform Qt offscreen) dengan alur pemakaian biasa
+(muat CSV, Gantt, ketiga analisis, ekspor PNG/PDF/SVG/EPS, ganti tema), lalu semua modul
+yang tidak pernah dimuat dari paket besar (pandas, numpy, matplotlib, PyQt6),
+pustaka standar yang berat, dan paket terinstal lain ikut di-exclude.
+
+Dengan --app mainrev02 yang direkam adalah aplikasi utama di folder induk (mainrev02.py):
+selain alur di atas juga ekspor PDF multi-halaman, laporan PDF, jendela Performa dengan log,
+mode batch (--batch), dan ringkasan log (--perf-report). Hasilnya dipakai untuk memeriksa
+daftar excludes statis di mainrev02.spec.
+
+Dipakai oleh build_app.py (pilihan "Optimized"), atau langsung:
+    python build_profile.py --modules                  # tampilkan excludes hasil perhitungan
+    python build_profile.py --app mainrev02 --modules  # excludes untuk mainrev02.spec
+"""
+
+import argparse
+import importlib
+import importlib.metadata
+import json
+import os
+import pkgutil
+import statistics
+import subprocess
+import sys
+import time
+
+from startup_bench import APP_NAME, RUN_TIMEOUT, find_frozen_executable, measure_window
+
+REPORT_FILE = 'build_report.json'
+
+# Paket yang dibundel; submodul level pertama yang tidak diimpor saat runtime di-exclude
+BUNDLED_PACKAGES = ['pandas', 'numpy', 'matplotlib', 'matplotlib.backends', 'PyQt6']
+
+# Pustaka standar berukuran besar yang tidak dibutuhkan aplikasi GUI ini
+STDLIB_CANDIDATES = [
+    'tkinter', 'unittest', 'doctest', 'pydoc', 'pydoc_data', 'test', 'lib2to3', 'distutils',
+    'xmlrpc', 'sqlite3', 'curses', 'idlelib', 'turtle', 'turtledemo', 'ensurepip', 'venv',
+]
+
+# Alur pemakaian yang direkam; dijalankan di proses terpisah dari folder ProjectApp
+EXERCISE_SCRIPT = r'''
+import json, os, sys, tempfile
+from PyQt6.QtWidgets import QApplication, QMessageBox
+import GanttAnalysisApp as gantt_app
+
+# Dialog modal akan menahan proses offscreen, jadi dilewati
+for name in ('information', 'warning', 'critical', 'about'):
+    setattr(QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+
+app = QApplication(sys.argv)
+window = gantt_app.MainWindow()
+window.show()
+app.processEvents()
+
+folder = tempfile.mkdtemp()
+csv_path = os.path.join(folder, 'contoh.csv')
+with open(csv_path, 'w', encoding='utf-8') as f:
+    f.write("Nama Tugas,Tanggal Mulai,Tanggal Selesai,Progress\n")
+    for i in range(30):
+        f.write(f"Tugas {i},2024-01-{i % 28 + 1:02d},2024-02-{i % 28 + 1:02d},{i * 3}\n")
+
+window.df = gantt_app.pd.read_csv(csv_path)
+window.update_column_combos()
+window.update_gantt_chart()
+for analysis in ("Durasi Tugas", "Distribusi Timeline", "Overlap Tugas"):
+    window.analysis_type_combo.setCurrentText(analysis)
+    window.update_analysis()
+# Format yang juga ditawarkan tombol simpan di toolbar matplotlib
+for extension in ('png', 'pdf', 'svg', 'eps'):
+    window.gantt_canvas.fig.savefig(os.path.join(folder, 'gantt.' + extension), dpi=50)
+    window.analysis_canvas.fig.savefig(os.path.join(folder, 'analisis.' + extension), dpi=50)
+window.toggle_theme()
+window.toggle_theme()
+app.processEvents()
+
+print(json.dumps(sorted(sys.modules)))
+'''
+
+
+# Alur pemakaian mainrev02; dijalankan di proses terpisah dari folder induk ProjectApp
+MAINREV_EXERCISE_SCRIPT = r'''
+import json, os, sys, tempfile, time
+folder = tempfile.mkdtemp()
+os.environ.update(GANTT_CACHE_DIR=os.path.join(folder, 'cache'), GANTT_PERF_LOG='1',
+                  GANTT_PERF_LOG_FILE=os.path.join(folder, 'perf_log.jsonl'))
+from PyQt6.QtWidgets import QApplication, QMessageBox, QFileDialog, QInputDialog
+import mainrev02
+
+# Dialog modal akan menahan proses offscreen, jadi dilewati
+for name in ('information', 'warning', 'critical', 'about'):
+    setattr(QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+save_path = []
+QFileDialog.getSaveFileName = staticmethod(lambda *args, **kwargs: (save_path[0], ''))
+QInputDialog.getInt = staticmethod(lambda *args, **kwargs: (args[3], True))
+
+app = QApplication(sys.argv)
+window = mainrev02.MainWindow()
+window.show()
+
+def wait(done):
+    while not done():
+        app.processEvents()
+        time.sleep(0.01)
+
+def export(action, file_name):
+    save_path[:] = [os.path.join(folder, file_name)]
+    action()
+    wait(lambda: window.export_thread is None)
+
+csv_path = os.path.join(folder, 'contoh.csv')
+with open(csv_path, 'w', encoding='utf-8') as f:
+    f.write("Nama Tugas,Tanggal Mulai,Tanggal Selesai,Progress\n")
+    for i in range(30):
+        f.write(f"Tugas {i},2024-01-{i % 28 + 1:02d},2024-02-{i % 28 + 1:02d},{i * 3}\n")
+
+window.start_warmup()
+wait(lambda: window.warmup_thread is None)
+window.show_performance()
+window.start_csv_load(csv_path)
+wait(lambda: window.load_thread is None)
+window.update_gantt_chart()
+wait(lambda: not window.analysis_runner.is_busy())
+app.processEvents()
+for extension in ('png', 'pdf', 'svg', 'eps'):
+    export(window.export_gantt, 'gantt.' + extension)
+export(window.export_gantt_pages, 'gantt_halaman.pdf')
+for analysis in ("Durasi Tugas", "Distribusi Timeline", "Overlap Tugas"):
+    window.analysis_type_combo.setCurrentText(analysis)
+    window.update_analysis()
+    wait(lambda: not window.analysis_runner.is_busy())
+    app.processEvents()
+export(window.export_analysis, 'analisis.png')
+export(window.export_report, 'laporan.pdf')
+window.toggle_theme()
+window.toggle_theme()
+app.processEvents()
+
+import gantt_batch, gantt_perf_report
+gantt_batch.main([csv_path, '-o', os.path.join(folder, 'batch'), '-j', '1'])
+gantt_batch.main([csv_path, '-o', os.path.join(folder, 'batch'), '-j', '1', '--report'])
+gantt_perf_report.main([folder])
+
+print(json.dumps(sorted(sys.modules)))
+'''
+
+# Script alur pemakaian dan folder kerja per aplikasi yang bisa direkam
+APP_PROBES = {
+    'GanttAnalysisApp': (EXERCISE_SCRIPT, None),
+    'mainrev02': (MAINREV_EXERCISE_SCRIPT,
+                  os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+}
+
+
+def collect_runtime_modules(app='GanttAnalysisApp'):
+    """Jalankan alur pemakaian aplikasi dan kembalikan semua modul yang termuat"""
+    script, cwd = APP_PROBES[app]
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, cwd=cwd,
+                            timeout=RUN_TIMEOUT, env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+    if result.returncode != 0:
+        raise RuntimeError(f"Gagal merekam modul runtime:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compute_excludes(runtime_modules):
+    """Hitung daftar excludes PyInstaller dari modul yang termuat saat runtime"""
+    runtime = set(runtime_modules)
+    runtime_top = {name.split('.')[0] for name in runtime}
+    excludes = set()
+
+    # Pustaka standar besar yang tidak pernah diimpor
+    excludes.update(name for name in STDLIB_CANDIDATES if name not in runtime_top)
+
+    # Paket pihak ketiga terinstal yang tidak pernah diimpor (misalnya lxml, scipy, IPython)
+    for name in importlib.metadata.packages_distributions():
+        if name.isidentifier() and not name.startswith('_') and name not in runtime_top:
+            excludes.add(name)
+
+    # Submodul paket besar yang tidak dipakai (tests, backend matplotlib lain, modul Qt lain)
+    for package in BUNDLED_PACKAGES:
+        if package not in runtime:
+            continue
+        path = importlib.import_module(package).__path__
+        for info in pkgutil.iter_modules(path, package + '.'):
+            # Hook PyInstaller milik paket (misalnya numpy._pyinstaller) tetap disertakan
+            if info.name not in runtime and not info.name.endswith('._pyinstaller'):
+                excludes.add(info.name)
+
+    return sorted(excludes)
+
+
+def bundle_size(path):
+    """Ukuran total file (byte) dari executable atau folder one-dir"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def largest_entries(folder, top=10):
+    """Entri (file/folder) terbesar di dalam bundle one-dir"""
+    internal = os.path.join(folder, '_internal')
+    if os.path.isdir(internal):
+        folder = internal
+    entries = [(name, bundle_size(os.path.join(folder, name))) for name in os.listdir(folder)]
+    entries.sort(key=lambda item: item[1], reverse=True)
+    return [{'name': name, 'mb': round(size / 1048576, 2)} for name, size in entries[:top]]
+
+
+def write_build_report(runtime_modules, excludes, onedir, runs=3, report_path=REPORT_FILE):
+    """Tulis ukuran bundle dan waktu cold-start executable ke laporan JSON"""
+    executable = find_frozen_executable()
+    if executable is None:
+        print("✗ Executable tidak ditemukan di folder dist")
+        return None
+
+    bundle = os.path.dirname(executable) if onedir else executable
+    samples = measure_window([os.path.abspath(executable)], runs)
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'mode': 'onedir' if onedir else 'onefile',
+        'executable': executable,
+        'bundle_mb': round(bundle_size(bundle) / 1048576, 2),
+        'largest_entries': largest_entries(bundle) if onedir else [],
+        'runtime_modules': len(runtime_modules),
+        'excludes': excludes,
+        'cold_start_seconds': samples[0]['total'],
+        'warm_start_seconds': statistics.median(s['total'] for s in samples[1:]) if runs > 1 else None,
+        'samples': samples,
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"✓ Bundle {report['mode']}: {report['bundle_mb']} MB, "
+          f"cold start {report['cold_start_seconds']:.2f}s")
+    print(f"  Laporan: {report_path}")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hitung excludes PyInstaller dari modul runtime")
+    parser.add_argument('--modules', action='store_true', help="Tampilkan daftar excludes")
+    parser.add_argument('--app', choices=sorted(APP_PROBES), default=APP_NAME,
+                        help=f"Aplikasi yang direkam (default: {APP_NAME})")
+    args = parser.parse_args(argv)
+
+    runtime_modules = collect_runtime_modules(args.app)
+    excludes = compute_excludes(runtime_modules)
+    print(f"{len(runtime_modules)} modul runtime {args.app}, {len(excludes)} modul di-exclude")
+    if args.modules:
+        print('\n'.join(excludes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
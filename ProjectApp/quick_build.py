@@ -59,6 +59,7 @@ def build_single_file():
         '--onefile',
         '--windowed',
         '--name=GanttAnalysisApp',
+        '--paths=..',
         'GanttAnalysisApp.py'
     ]
     
@@ -95,6 +96,7 @@ def build_with_hidden_imports():
         '--hidden-import=matplotlib.backends.backend_qt5agg',
         '--hidden-import=matplotlib.figure',
         '--hidden-import=matplotlib.dates',
+        '--paths=..',
         'GanttAnalysisApp.py'
     ]
     
@@ -124,6 +126,7 @@ def build_directory_mode():
         '--onedir',
         '--windowed',
         '--name=GanttAnalysisApp',
+        '--paths=..',
         'GanttAnalysisApp.py'
     ]
     
@@ -144,6 +147,16 @@ def build_directory_mode():
         print(f"❌ Error during build: {e}")
         return False
 
+def benchmark_startup():
+    """Benchmark startup time (source and executable), fails when over budget"""
+    from startup_bench import run_benchmark, find_frozen_executable
+    
+    try:
+        return run_benchmark(find_frozen_executable())
+    except RuntimeError as e:
+        print(f"❌ Startup benchmark failed: {e}")
+        return False
+
 def main():
     """Main function"""
     print("="*50)
@@ -193,6 +206,11 @@ def main():
         input("Press Enter to exit...")
         return
     
+    # Step 5: Startup benchmark (budget via GANTT_STARTUP_BUDGET)
+    if success:
+        print("\n📋 Step 5: Benchmarking startup time...")
+        success = benchmark_startup()
+    
     # Results
     if success:
         print("\n🎉 BUILD COMPLETED SUCCESSFULLY!")
@@ -214,8 +232,10 @@ def main():
         print("2. Install Visual C++ Redistributable (Windows)")
         print("3. Run with --console flag to see detailed errors")
         print("4. Check if all dependencies are installed")
+        print("5. If startup is over budget, see startup_report.json")
     
     input("\nPress Enter to exit...")
+    return success
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
\ No newline at end of file
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark waktu startup aplikasi Gantt Chart (versi source dan executable hasil build)
+
+Yang diukur (platform Qt offscreen, tanpa menampilkan jendela sungguhan):
+- start interpreter : dari proses dibuat sampai baris pertama GanttAnalysisApp.py berjalan
+                      (untuk executable one-file termasuk ekstraksi ke folder temp)
+- import            : dari baris pertama sampai main() dipanggil (semua import selesai)
+- jendela           : dari main() sampai jendela tampil dan event loop berjalan
+- import per modul  : dari `python -X importtime` (hanya versi source)
+
+Hasil ditulis ke startup_report.json. Exit code 1 jika median waktu sampai jendela tampil
+melebihi anggaran (default 10 detik, bisa diubah dengan --budget atau GANTT_STARTUP_BUDGET).
+
+Dipakai oleh build_app.py dan quick_build.py, atau langsung:
+    python startup_bench.py --frozen dist/GanttAnalysisApp --runs 5 --budget 6
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_SCRIPT = 'GanttAnalysisApp.py'
+APP_NAME = 'GanttAnalysisApp'
+REPORT_FILE = 'startup_report.json'
+
+# Anggaran default waktu sampai jendela tampil (detik)
+DEFAULT_BUDGET = 10.0
+# Batas waktu satu kali menjalankan aplikasi (detik)
+RUN_TIMEOUT = 120
+
+
+def startup_budget():
+    """Anggaran startup dari environment variable, atau nilai default"""
+    return float(os.environ.get('GANTT_STARTUP_BUDGET', DEFAULT_BUDGET))
+
+
+def find_frozen_executable(dist_dir='dist'):
+    """Cari executable hasil build (one-file atau one-dir), None jika belum ada"""
+    suffix = '.exe' if sys.platform == 'win32' else ''
+    candidates = [
+        os.path.join(dist_dir, APP_NAME + suffix),                # one-file
+        os.path.join(dist_dir, APP_NAME, APP_NAME + suffix),      # one-dir
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def measure_interpreter(runs):
+    """Waktu start interpreter Python kosong (acuan untuk versi source)"""
+    times = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        times.append(time.time() - start)
+    return times
+
+
+def measure_imports(top=15):
+    """Waktu import per modul level atas dari `python -X importtime` (detik, urut terlama)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {APP_NAME}'],
+                            capture_output=True, text=True, timeout=RUN_TIMEOUT,
+                            env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+
+    # Format baris: "import time: self [us] | cumulative | nama modul", indentasi nama menunjukkan
+    # kedalaman dan sub-import dicetak sebelum modul induknya
+    modules = []
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append({'module': name.strip(), 'seconds': int(cumulative) / 1e6})
+        elif depth == 0:
+            if name.strip() == APP_NAME:
+                modules = children
+            children = []
+
+    modules.sort(key=lambda item: item['seconds'], reverse=True)
+    return modules[:top]
+
+
+def measure_window(command, runs):
+    """Jalankan aplikasi beberapa kali dan catat waktu tiap tahap startup (detik)"""
+    samples = []
+    for _ in range(runs):
+        fd, report_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen', GANTT_STARTUP_REPORT=report_path)
+        try:
+            start = time.time()
+            subprocess.run(command, env=env, timeout=RUN_TIMEOUT,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            with open(report_path, encoding='utf-8') as f:
+                marks = json.load(f)
+        except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(f"Aplikasi tidak melaporkan waktu startup: {e}")
+        finally:
+            os.remove(report_path)
+
+        samples.append({
+            'interpreter': marks['module_start'] - start,
+            'imports': marks['main_start'] - marks['module_start'],
+            'window': marks['window_shown'] - marks['main_start'],
+            'total': marks['window_shown'] - start,
+        })
+    return samples
+
+
+def summarize(samples):
+    """Median tiap tahap dari beberapa kali run"""
+    return {stage: statistics.median(sample[stage] for sample in samples) for stage in samples[0]}
+
+
+def run_benchmark(frozen_executable=None, runs=3, budget=None, report_path=REPORT_FILE):
+    """Benchmark versi source (dan executable jika ada), tulis laporan JSON.
+
+    Kembalikan True jika semua varian berada dalam anggaran startup.
+    """
+    budget = startup_budget() if budget is None else budget
+    print(f"⏱  Benchmark startup ({runs}x, anggaran {budget:.1f} detik sampai jendela tampil)")
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'budget_seconds': budget,
+        'runs': runs,
+        'interpreter_seconds': statistics.median(measure_interpreter(runs)),
+        'imports': measure_imports(),
+        'variants': {},
+    }
+
+    variants = [('source', [sys.executable, APP_SCRIPT])]
+    if frozen_executable:
+        variants.append(('frozen', [os.path.abspath(frozen_executable)]))
+
+    passed = True
+    for name, command in variants:
+        samples = measure_window(command, runs)
+        median = summarize(samples)
+        within_budget = median['total'] <= budget
+        passed = passed and within_budget
+        report['variants'][name] = {'command': command, 'samples': samples, 'median': median,
+                                    'within_budget': within_budget}
+
+        mark = '✓' if within_budget else '✗'
+        print(f"{mark} {name:<6} total {median['total']:.2f}s "
+              f"(interpreter {median['interpreter']:.2f}s, import {median['imports']:.2f}s, "
+              f"jendela {median['window']:.2f}s)")
+
+    if report['imports']:
+        slowest = ', '.join(f"{m['module']} {m['seconds']:.2f}s" for m in report['imports'][:5])
+        print(f"   Import terlama (source): {slowest}")
+
+    report['passed'] = passed
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"   Laporan: {report_path}")
+
+    if not passed:
+        print(f"✗ Waktu startup melebihi anggaran {budget:.1f} detik")
+    return passed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup GanttAnalysisApp")
+    parser.add_argument('--frozen', help="Path executable hasil build (default: dicari di dist/)")
+    parser.add_argument('--source-only', action='store_true', help="Lewati executable hasil build")
+    parser.add_argument('--runs', type=int, default=3, help="Jumlah run per varian (default: 3)")
+    parser.add_argument('--budget', type=float, default=None,
+                        help=f"Anggaran detik sampai jendela tampil (default: {DEFAULT_BUDGET})")
+    parser.add_argument('--report', default=REPORT_FILE, help="File laporan JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    frozen = None if args.source_only else (args.frozen or find_frozen_executable())
+    return 0 if run_benchmark(frozen, args.runs, args.budget, args.report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Benchmark perhitungan overlap tugas: loop per tanggal vs sweep-line
+
+Jalankan dengan: python bench_overlap.py [jumlah_tugas] [jumlah_hari]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from gantt_core import count_active_tasks
+
+
+def count_active_tasks_loop(starts, ends):
+    """Implementasi lama: satu mask boolean penuh untuk setiap tanggal"""
+    date_range = pd.date_range(start=starts.min(), end=ends.max())
+    active_tasks = []
+    for date in date_range.to_numpy():
+        active_tasks.append(int(np.count_nonzero((starts <= date) & (ends >= date))))
+    return date_range, np.array(active_tasks)
+
+
+def make_tasks(n_tasks, n_days, seed=0):
+    """Buat data tugas acak dalam rentang n_days hari"""
+    rng = np.random.default_rng(seed)
+    base = np.datetime64('2020-01-01T00:00:00', 'ns')
+    offsets = rng.integers(0, n_days * 24, n_tasks).astype('timedelta64[h]')
+    lengths = rng.integers(-24, 90 * 24, n_tasks).astype('timedelta64[h]')
+    starts = base + offsets
+    ends = starts + lengths
+    return starts, ends
+
+
+def main():
+    n_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 3 * 365
+    starts, ends = make_tasks(n_tasks, n_days)
+
+    t0 = time.perf_counter()
+    sweep_range, sweep_counts = count_active_tasks(starts, ends)
+    sweep_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    loop_range, loop_counts = count_active_tasks_loop(starts, ends)
+    loop_time = time.perf_counter() - t0
+
+    assert sweep_range.equals(loop_range)
+    assert np.array_equal(sweep_counts, loop_counts)
+
+    print(f"{n_tasks:,} tugas, {len(sweep_range):,} hari")
+    print(f"loop per tanggal : {loop_time:8.3f} s")
+    print(f"sweep-line       : {sweep_time:8.3f} s")
+    print(f"percepatan       : {loop_time / sweep_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
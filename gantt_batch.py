@@ -0,0 +1,233 @@
+"""
+Render Gantt Chart dan ketiga grafik analisis untuk banyak file CSV tanpa GUI
+
+Setiap file dikerjakan di worker process terpisah dengan canvas Agg (tanpa QApplication).
+Contoh:
+    python gantt_batch.py data/ -o hasil/
+    python gantt_batch.py "data/*.csv" --task "Nama Tugas" --start "Mulai" --end "Selesai"
+    python mainrev02.py --batch data/ -j 4
+    python gantt_batch.py data/ --report
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gantt_core import ColumnTypeDetector, TaskTable, read_task_csv, guess_task_columns, compute_report
+from gantt_charts import (draw_gantt, draw_task_duration, draw_timeline_histogram,
+                          draw_task_overlap, render_figure, render_report)
+
+
+# Ukuran gambar (inci) sama dengan canvas di GUI
+FIGURE_SIZE = (10, 8)
+
+
+def find_csv_files(inputs):
+    """Kumpulkan file CSV dari daftar folder, pola glob, atau path file (tanpa duplikat)"""
+    files = []
+    seen = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(glob.glob(os.path.join(item, '*.csv')))
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item))
+        else:
+            matches = [item]
+        for path in matches:
+            # File yang sama bisa muncul lewat path langsung, folder, dan glob sekaligus
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                files.append(path)
+    return files
+
+
+def output_stems(files):
+    """Nama dasar file keluaran per CSV, unik walaupun ada nama file sama di folder berbeda
+
+    Nama yang bentrok diberi path relatif dari folder induk bersama (misalnya data_a_proyek),
+    dan jika masih bentrok diberi nomor urut.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in files]
+    lowered = [stem.lower() for stem in stems]
+    duplicated = {stem for stem in lowered if lowered.count(stem) > 1}
+
+    root = None
+    if duplicated:
+        try:
+            root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files])
+        except ValueError:
+            # Drive berbeda di Windows, cukup diberi nomor urut
+            pass
+
+    result = []
+    used = set()
+    for path, stem in zip(files, stems):
+        if root is not None and stem.lower() in duplicated:
+            relative = os.path.relpath(os.path.splitext(os.path.abspath(path))[0], root)
+            stem = relative.replace(os.sep, '_').replace('/', '_')
+        # Dibandingkan tanpa membedakan huruf besar/kecil karena sistem file Windows juga begitu
+        candidate = stem
+        number = 2
+        while candidate.lower() in used:
+            candidate = f"{stem}_{number}"
+            number += 1
+        used.add(candidate.lower())
+        result.append(candidate)
+    return result
+
+
+def render_csv(file_path, output_dir, columns=None, top_n=10, dpi=150, image_format='png',
+               report=False, stem=None):
+    """Hitung dan render semua grafik untuk satu CSV (dijalankan di worker process)
+
+    Dengan report=True semua grafik ditulis sebagai satu laporan PDF multi-halaman.
+    File keluaran diberi nama <stem>_*, default nama file CSV tanpa ekstensi.
+    """
+    timings = {}
+    start_time = time.perf_counter()
+
+    detector = ColumnTypeDetector()
+    df = read_task_csv(file_path, detector=detector)
+    timings['baca'] = time.perf_counter() - start_time
+
+    # Kolom yang tidak diberikan lewat argumen ditebak seperti di GUI
+    guessed = guess_task_columns(df, detector)
+    columns = {key: (columns or {}).get(key) or guessed[key] for key in guessed}
+    missing = [key for key in ('task', 'start', 'end') if not columns[key]]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+
+    step_time = time.perf_counter()
+    table = TaskTable(df, columns['task'], columns['start'], columns['end'],
+                      columns['progress'], detector)
+    results = compute_report(table, top_n)
+    timings['hitung'] = time.perf_counter() - step_time
+
+    step_time = time.perf_counter()
+    if stem is None:
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+    outputs = []
+    if report:
+        output_path = os.path.join(output_dir, f"{stem}_laporan.pdf")
+        render_report(results, output_path)
+        outputs.append(output_path)
+    else:
+        charts = [
+            ('gantt', draw_gantt, results['gantt']),
+            ('durasi', draw_task_duration, results['duration']),
+            ('timeline', draw_timeline_histogram, results['timeline']),
+            ('overlap', draw_task_overlap, results['overlap']),
+        ]
+        for name, draw, result in charts:
+            if result is None:
+                continue
+            output_path = os.path.join(output_dir, f"{stem}_{name}.{image_format}")
+            render_figure(draw, result, output_path, dpi, FIGURE_SIZE)
+            outputs.append(output_path)
+    timings['gambar'] = time.perf_counter() - step_time
+    timings['total'] = time.perf_counter() - start_time
+
+    return {'file': file_path, 'rows': len(df), 'tasks': len(table), 'skipped': table.skipped_rows,
+            'timings': timings, 'outputs': outputs}
+
+
+def print_summary(results, wall_time):
+    """Cetak ringkasan waktu per file"""
+    # Path ditulis seperti yang diberikan agar file bernama sama di folder berbeda terbedakan
+    name_width = max([len(r['file']) for r in results] + [4])
+    header = (f"{'File':<{name_width}}  {'Baris':>9}  {'Baca':>7}  {'Hitung':>7}  "
+              f"{'Gambar':>7}  {'Total':>7}  Status")
+    print()
+    print(header)
+    print('-' * len(header))
+
+    failed = 0
+    busy_time = 0.0
+    for r in results:
+        name = r['file']
+        if 'error' in r:
+            failed += 1
+            print(f"{name:<{name_width}}  {'-':>9}  {'-':>7}  {'-':>7}  {'-':>7}  {'-':>7}  "
+                  f"GAGAL: {r['error']}")
+            continue
+        t = r['timings']
+        busy_time += t['total']
+        # Baris dengan tanggal kosong atau tidak valid tidak ikut digambar
+        skipped = f", {r['skipped']:,} baris dilewati" if r['skipped'] else ""
+        print(f"{name:<{name_width}}  {r['rows']:>9,}  {t['baca']:>6.2f}s  {t['hitung']:>6.2f}s  "
+              f"{t['gambar']:>6.2f}s  {t['total']:>6.2f}s  OK ({len(r['outputs'])} file{skipped})")
+
+    print('-' * len(header))
+    print(f"{len(results)} file, {failed} gagal. Waktu total {wall_time:.2f}s "
+          f"(jumlah waktu per file {busy_time:.2f}s)")
+
+
+def run_batch(files, output_dir, columns=None, top_n=10, dpi=150, image_format='png', workers=None,
+              report=False):
+    """Render semua file di process pool, kembalikan hasil per file sesuai urutan input"""
+    os.makedirs(output_dir, exist_ok=True)
+    results = {}
+
+    # Nama keluaran ditentukan sebelum worker berjalan agar tidak ada file yang saling menimpa
+    stems = output_stems(files)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_csv, path, output_dir, columns, top_n, dpi, image_format,
+                               report, stem): path
+                   for path, stem in zip(files, stems)}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+                status = f"{results[path]['timings']['total']:.2f}s"
+            except Exception as e:
+                results[path] = {'file': path, 'error': str(e)}
+                status = f"gagal ({e})"
+            print(f"[{done}/{len(files)}] {path}: {status}", flush=True)
+
+    return [results[path] for path in files]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render Gantt Chart dan grafik analisis untuk banyak file CSV tanpa GUI")
+    parser.add_argument('inputs', nargs='+', help="Folder, pola glob, atau file CSV")
+    parser.add_argument('-o', '--output', default='hasil_batch', help="Folder keluaran gambar")
+    parser.add_argument('--task', help="Kolom tugas (default: ditebak)")
+    parser.add_argument('--start', help="Kolom tanggal mulai (default: ditebak)")
+    parser.add_argument('--end', help="Kolom tanggal selesai (default: ditebak)")
+    parser.add_argument('--progress', help="Kolom progress (opsional)")
+    parser.add_argument('--top-n', type=int, default=10, help="Jumlah tugas terpanjang (default: 10)")
+    parser.add_argument('--dpi', type=int, default=150, help="Resolusi gambar (default: 150)")
+    parser.add_argument('--format', dest='image_format', default='png', choices=['png', 'pdf', 'svg'],
+                        help="Format gambar (default: png)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Jumlah worker process (default: jumlah CPU)")
+    parser.add_argument('--report', action='store_true',
+                        help="Tulis semua grafik sebagai satu laporan PDF per file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    files = find_csv_files(args.inputs)
+    if not files:
+        print("Tidak ada file CSV yang ditemukan", file=sys.stderr)
+        return 1
+
+    columns = {'task': args.task, 'start': args.start, 'end': args.end, 'progress': args.progress}
+    print(f"Memproses {len(files)} file CSV ke {args.output}...")
+
+    start_time = time.perf_counter()
+    results = run_batch(files, args.output, columns, args.top_n, args.dpi, args.image_format,
+                        args.workers, args.report)
+    print_summary(results, time.perf_counter() - start_time)
+    return 1 if any('error' in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
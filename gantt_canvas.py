@@ -0,0 +1,130 @@
+"""
+Widget canvas matplotlib untuk Gantt Chart dan grafik analisis di GUI
+
+Modul ini memuat matplotlib (pyplot dan backend Qt), sehingga mainrev02.py baru
+mengimpornya setelah jendela utama tampil.
+"""
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+# Diekspor ulang untuk mainrev02.py agar backend Qt hanya diimpor lewat modul ini
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar  # noqa: F401
+
+from gantt_charts import (GanttChart, draw_gantt, draw_task_duration, draw_timeline_histogram,
+                          draw_task_overlap, capture_view)
+from gantt_perf import NULL_OPERATION
+
+
+class ResultCanvas(FigureCanvas):
+    """Canvas yang menyimpan Axes beberapa hasil terakhir beserta artist-nya
+    
+    AnalysisCache mengembalikan objek hasil yang sama setiap kali diambil, sehingga Axes
+    dicari berdasarkan identitas hasil. Hasil yang sudah pernah digambar cukup ditampilkan
+    kembali (tanpa membuat artist dan tanpa tight_layout), hanya Axes aktif yang terlihat.
+    """
+    
+    # Jumlah Axes yang disimpan per canvas (LRU)
+    MAX_CACHED_AXES = 4
+    
+    def __init__(self, parent=None, width=10, height=8, dpi=100):
+        self.fig, self.ax = plt.subplots(figsize=(width, height), dpi=dpi)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.fig.tight_layout()
+        self._axes_cache = []   # [hasil, Axes, isi, parameter subplot], yang terbaru di akhir
+    
+    def _show_result(self, result, plot, operation=NULL_OPERATION):
+        """Tampilkan hasil di Axes-nya; plot(ax) dipanggil hanya untuk hasil yang belum digambar
+        
+        Mengembalikan isi yang dibuat plot (misalnya GanttChart) untuk hasil tersebut.
+        """
+        for entry in self._axes_cache:
+            if entry[0] is result:
+                self._axes_cache.remove(entry)
+                self._axes_cache.append(entry)
+                self._activate(entry[1])
+                self.fig.subplots_adjust(**entry[3])
+                with operation.stage('draw'):
+                    self.draw()
+                return entry[2]
+        
+        # Axes awal dipakai untuk hasil pertama, berikutnya dibuat Axes baru
+        ax = self.fig.add_subplot() if self._axes_cache else self.ax
+        self._activate(ax)
+        with operation.stage('plot'):
+            content = plot(ax)
+        with operation.stage('layout'):
+            self.fig.tight_layout()
+        pars = {name: getattr(self.fig.subplotpars, name)
+                for name in ('left', 'bottom', 'right', 'top')}
+        self._axes_cache.append([result, ax, content, pars])
+        while len(self._axes_cache) > self.MAX_CACHED_AXES:
+            self._axes_cache.pop(0)[1].remove()
+        with operation.stage('draw'):
+            self.draw()
+        return content
+    
+    def _activate(self, ax):
+        """Jadikan ax satu-satunya Axes yang terlihat dan bisa di-zoom/pan"""
+        for other in self.fig.axes:
+            other.set_visible(other is ax)
+            other.set_navigate(other is ax)
+        self.ax = ax
+
+
+class GanttChartCanvas(ResultCanvas):
+    """Widget untuk menampilkan Gantt Chart"""
+    
+    def __init__(self, parent=None, width=10, height=8, dpi=100):
+        super().__init__(parent, width, height, dpi)
+        
+        # Isi chart (bar, label, indeks interval) dikelola GanttChart, satu per Axes
+        self.chart = GanttChart(self.ax)
+        self.prepared = None
+        
+    def plot_gantt(self, prepared, operation=NULL_OPERATION):
+        """Membuat Gantt chart dari geometri hasil prepare_gantt"""
+        if prepared is None:
+            return
+        
+        self.prepared = prepared
+        self.chart = self._show_result(prepared, lambda ax: draw_gantt(ax, prepared), operation)
+    
+    def snapshot(self):
+        """Data dan tampilan chart saat ini untuk dirender ulang di luar thread GUI"""
+        if self.prepared is None:
+            return None
+        return draw_gantt, self.prepared, capture_view(self.fig, self.ax)
+
+
+class AnalysisCanvas(ResultCanvas):
+    """Widget untuk menampilkan visualisasi analisis data"""
+    
+    def __init__(self, parent=None, width=10, height=8, dpi=100):
+        super().__init__(parent, width, height, dpi)
+        self.current = None
+
+    def plot_task_duration(self, result, operation=NULL_OPERATION):
+        """Membuat grafik durasi tugas dari hasil compute_task_duration"""
+        self._plot(draw_task_duration, result, operation)
+        
+    def plot_timeline_histogram(self, result, operation=NULL_OPERATION):
+        """Membuat histogram distribusi waktu mulai dan selesai tugas"""
+        self._plot(draw_timeline_histogram, result, operation)
+        
+    def plot_task_overlap(self, result, operation=NULL_OPERATION):
+        """Membuat grafik overlap tugas per periode"""
+        self._plot(draw_task_overlap, result, operation)
+    
+    def snapshot(self):
+        """Data dan tampilan grafik saat ini untuk dirender ulang di luar thread GUI"""
+        if self.current is None:
+            return None
+        draw, result = self.current
+        return draw, result, capture_view(self.fig, self.ax)
+    
+    def _plot(self, draw, result, operation=NULL_OPERATION):
+        if result is None:
+            return
+        self.current = (draw, result)
+        self._show_result(result, lambda ax: draw(ax, result), operation)
@@ -0,0 +1,508 @@
+"""
+Penggambaran Gantt Chart dan grafik analisis pada Axes matplotlib (tanpa Qt dan pyplot)
+
+Dipakai oleh canvas GUI di mainrev02.py maupun oleh batch/ekspor yang memakai canvas Agg.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import matplotlib
+import matplotlib.dates as mdates
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.ticker import FuncFormatter, Locator
+
+
+class BarLabelCollection(Artist):
+    """Satu artist yang menggambar banyak label teks terpusat dalam satu kali draw"""
+    
+    def __init__(self, x, y, texts, widths, bar_height, color='white', fontproperties=None):
+        super().__init__()
+        self.bar_height = bar_height
+        self.color = color
+        self.fontproperties = fontproperties if fontproperties is not None else FontProperties()
+        self._extents = {}
+        self.set_data(x, y, texts, widths)
+        
+        # Gambar di atas bar seperti Text biasa, dan tidak ikut perhitungan
+        # tight_layout karena label selalu berada di dalam axes
+        self.set_zorder(3)
+        self.set_in_layout(False)
+    
+    def set_data(self, x, y, texts, widths):
+        """Ganti label yang dikelola artist ini"""
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.widths = np.asarray(widths, dtype=float)
+        self.texts = list(texts)
+        
+        # Teks unik (misalnya "5 hari") cukup diukur sekali untuk semua bar
+        self._unique_texts, self._text_codes = np.unique(np.asarray(self.texts, dtype=object),
+                                                         return_inverse=True)
+        
+        # Indeks label yang terlihat untuk view saat ini, dihitung ulang saat zoom/pan
+        self.invalidate_visible()
+    
+    def set_color(self, color):
+        self.color = color
+        self.stale = True
+    
+    def invalidate_visible(self, *args):
+        """Tandai daftar label terlihat perlu dihitung ulang (dipanggil saat batas axes berubah)"""
+        self._shown = None
+        self.stale = True
+    
+    def _text_extent(self, renderer, text):
+        """Ukuran teks di-cache per string, durasi yang sama hanya diukur sekali"""
+        key = (text, renderer.points_to_pixels(1.0))
+        extent = self._extents.get(key)
+        if extent is None:
+            extent = renderer.get_text_width_height_descent(text, self.fontproperties, ismath=False)
+            self._extents[key] = extent
+        return extent
+    
+    def _visible_indices(self, renderer):
+        """Pilih label yang bar-nya terlihat dan cukup besar untuk menampung teks"""
+        bbox = self.axes.bbox
+        key = (bbox.width, bbox.height, renderer.points_to_pixels(1.0))
+        if self._shown is not None and self._shown_key == key:
+            return self._shown
+        
+        x0, x1 = sorted(self.axes.get_xlim())
+        y0, y1 = sorted(self.axes.get_ylim())
+        visible = np.empty(0, dtype=int)
+        
+        if x1 > x0 and y1 > y0 and len(self.texts):
+            extents = np.array([self._text_extent(renderer, text) for text in self._unique_texts])
+            text_widths = extents[:, 0][self._text_codes]
+            text_height = extents[:, 1].max()
+            
+            # Skala piksel per satuan data untuk view saat ini
+            scale_x = bbox.width / (x1 - x0)
+            scale_y = bbox.height / (y1 - y0)
+            
+            # Jika baris terlalu rapat, tidak ada label yang terbaca
+            if self.bar_height * scale_y >= text_height:
+                in_view = ((self.x >= x0) & (self.x <= x1) &
+                           (self.y >= y0) & (self.y <= y1))
+                wide_enough = self.widths * scale_x >= text_widths
+                visible = np.flatnonzero(in_view & wide_enough)
+        
+        self._shown = visible
+        self._shown_key = key
+        return visible
+    
+    def draw(self, renderer):
+        if not self.get_visible() or not self.texts:
+            return
+        
+        visible = self._visible_indices(renderer)
+        if len(visible) == 0:
+            self.stale = False
+            return
+        
+        renderer.open_group('bar_labels', gid=self.get_gid())
+        gc = renderer.new_gc()
+        gc.set_foreground(self.color)
+        gc.set_alpha(self.get_alpha())
+        self._set_gc_clip(gc)
+        
+        points = self.axes.transData.transform(np.column_stack([self.x[visible], self.y[visible]]))
+        _, canvas_height = renderer.get_canvas_width_height()
+        flip = renderer.flipy()
+        
+        for (px, py), index in zip(points.tolist(), visible.tolist()):
+            text = self.texts[index]
+            width, height, descent = self._text_extent(renderer, text)
+            # Posisi baseline agar teks terpusat seperti ha='center', va='center'
+            x = px - width / 2
+            y = py - height / 2 + descent
+            if flip:
+                y = canvas_height - y
+            renderer.draw_text(gc, x, y, text, self.fontproperties, 0)
+        
+        gc.restore()
+        renderer.close_group('bar_labels')
+        self.stale = False
+
+
+class TaskTickLocator(Locator):
+    """Locator sumbu-y yang hanya memberi tick untuk baris tugas yang terlihat dan tidak bertumpuk"""
+    
+    def __init__(self, n_tasks):
+        self.n_tasks = n_tasks
+    
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+    
+    def tick_values(self, vmin, vmax):
+        vmin, vmax = sorted((vmin, vmax))
+        first = max(0, int(np.ceil(vmin)))
+        last = min(self.n_tasks - 1, int(np.floor(vmax)))
+        if last < first:
+            return np.empty(0)
+        
+        # Batasi jumlah tick sesuai tinggi axes dan ukuran font label
+        axes = self.axis.axes
+        font_size = FontProperties(size=matplotlib.rcParams['ytick.labelsize']).get_size_in_points()
+        font_pixels = font_size * axes.figure.dpi / 72 * 1.2
+        max_ticks = max(1, int(axes.bbox.height / font_pixels))
+        step = max(1, int(np.ceil((last - first + 1) / max_ticks)))
+        
+        # Mulai dari kelipatan step agar label tidak "melompat" saat pan
+        start = int(np.ceil(first / step)) * step
+        return np.arange(start, last + 1, step)
+
+
+class TaskBarCollection(PolyCollection):
+    """PolyCollection untuk bar Gantt yang vertex-nya sudah berupa angka tanggal matplotlib"""
+    
+    def have_units(self):
+        # Sumbu-x memakai unit tanggal, tetapi vertex sudah hasil date2num sehingga
+        # konversi unit per path (sangat lambat untuk ribuan bar) bisa dilewati
+        return False
+
+
+def task_label(tasks, value):
+    """Nama tugas untuk posisi tick di sumbu-y"""
+    index = int(round(value))
+    if 0 <= index < len(tasks):
+        return str(tasks[index])
+    return ''
+
+
+class GanttChart:
+    """Gantt Chart pada satu Axes, bar dan label hanya dibuat untuk tugas yang terlihat"""
+    
+    # Setengah tinggi bar dalam satuan baris
+    BAR_HALF_HEIGHT = 0.25
+    
+    def __init__(self, ax):
+        self.ax = ax
+        self.bars = None
+        self.duration_labels = None
+        self.interval_index = None
+    
+    def plot(self, prepared):
+        """Gambar Gantt chart dari geometri hasil prepare_gantt"""
+        tasks = prepared['tasks']
+        
+        # Bar hanya dibuat untuk tugas yang terlihat, lihat update_visible_tasks
+        self.bar_lefts = prepared['lefts']
+        self.bar_widths = prepared['widths']
+        self.bar_durations = prepared['durations']
+        self.bar_colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(tasks)))
+        self.interval_index = prepared['index']
+        
+        # Bersihkan plot sebelumnya
+        self.ax.clear()
+        
+        # Atur y-axis, hanya baris yang terlihat yang mendapat label
+        self.ax.yaxis.set_major_locator(TaskTickLocator(len(tasks)))
+        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda value, pos: task_label(tasks, value)))
+        
+        # Semua bar digambar sebagai satu PolyCollection, bukan satu barh per tugas
+        self.bars = TaskBarCollection([], edgecolors='black', alpha=0.8)
+        self.ax.add_collection(self.bars, autolim=False)
+        self.ax.set_ylim(-0.75, len(tasks) - 0.25)
+        
+        # Tambahkan teks durasi sebagai satu artist
+        self.duration_labels = BarLabelCollection([], [], [], [], 2 * self.BAR_HALF_HEIGHT,
+                                                  color='white',
+                                                  fontproperties=FontProperties(weight='bold'))
+        self.ax.add_artist(self.duration_labels)
+        
+        # Format x-axis sebagai tanggal
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        
+        # Atur batasan x-axis
+        self.ax.set_xlim(prepared['min_date'], prepared['max_date'])
+        
+        # Tambahkan label dan judul
+        self.ax.set_xlabel('Tanggal')
+        self.ax.set_ylabel('Tugas')
+        self.ax.set_title('Gantt Chart')
+        
+        # Rotasi label tanggal untuk keterbacaan
+        self.ax.tick_params(axis='x', labelrotation=45)
+        
+        # Format grid
+        self.ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+        
+        # Perbarui isi bar setiap kali batas axes berubah (zoom/pan)
+        self.ax.callbacks.connect('xlim_changed', self.update_visible_tasks)
+        self.ax.callbacks.connect('ylim_changed', self.update_visible_tasks)
+        self.update_visible_tasks()
+    
+    def update_visible_tasks(self, ax=None):
+        """Isi PolyCollection dan label hanya dengan tugas yang beririsan dengan view"""
+        if self.interval_index is None:
+            return
+        
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        row0 = max(0, int(np.floor(y0 - self.BAR_HALF_HEIGHT)))
+        row1 = min(len(self.bar_lefts), int(np.ceil(y1 + self.BAR_HALF_HEIGHT)) + 1)
+        visible = self.interval_index.query(x0, x1, row0, row1)
+        
+        lefts = self.bar_lefts[visible]
+        widths = self.bar_widths[visible]
+        rows = visible.astype(float)
+        
+        verts = np.empty((len(visible), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = lefts
+        verts[:, 2, 0] = verts[:, 3, 0] = lefts + widths
+        verts[:, 0, 1] = verts[:, 3, 1] = rows - self.BAR_HALF_HEIGHT
+        verts[:, 1, 1] = verts[:, 2, 1] = rows + self.BAR_HALF_HEIGHT
+        self.bars.set_verts(verts)
+        self.bars.set_facecolor(self.bar_colors[visible])
+        
+        texts = [f"{duration} hari" for duration in self.bar_durations[visible].tolist()]
+        self.duration_labels.set_data(lefts + widths / 2, rows, texts, widths)
+
+
+def draw_gantt(ax, prepared):
+    """Gambar Gantt chart pada Axes; GanttChart dikembalikan agar callback zoom tetap hidup"""
+    chart = GanttChart(ax)
+    chart.plot(prepared)
+    return chart
+
+
+def draw_task_duration(ax, result):
+    """Grafik durasi tugas dari hasil compute_task_duration"""
+    tasks = result['tasks']
+    durations = result['durations']
+    positions = np.arange(len(tasks))
+    
+    # Bersihkan plot sebelumnya
+    ax.clear()
+    
+    # Plot horizontal bar chart
+    bars = ax.barh(positions, durations, color='skyblue')
+    
+    # Label tugas hanya untuk baris yang muat di sumbu-y
+    ax.yaxis.set_major_locator(TaskTickLocator(len(tasks)))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda value, pos: task_label(tasks, value)))
+    
+    # Tambahkan nilai pada bar, hanya untuk baris yang cukup renggang untuk dibaca
+    for position in ax.yaxis.get_major_locator()().astype(int):
+        bar = bars[position]
+        width = bar.get_width()
+        ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, 
+                f"{int(width)} hari", va='center')
+    
+    # Tambahkan label dan judul
+    ax.set_xlabel('Durasi (hari)')
+    ax.set_ylabel('Tugas')
+    ax.set_title(f'{len(tasks)} Tugas dengan Durasi Terpanjang')
+    
+    # Format grid
+    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+
+
+def draw_timeline_histogram(ax, result):
+    """Histogram distribusi tanggal mulai dan selesai dari hasil compute_timeline_histogram"""
+    # Bersihkan plot sebelumnya
+    ax.clear()
+    
+    # Plot histogram dari jumlah per bin yang sudah dihitung
+    edges = result['edges']
+    ax.xaxis_date()
+    ax.hist([edges[:-1], edges[:-1]], bins=edges,
+            weights=[result['start_counts'], result['end_counts']],
+            label=['Tanggal Mulai', 'Tanggal Selesai'],
+            alpha=0.7)
+    
+    # Format x-axis sebagai tanggal
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    
+    # Tambahkan label dan judul
+    ax.set_xlabel('Tanggal')
+    ax.set_ylabel('Jumlah Tugas')
+    ax.set_title('Distribusi Tanggal Mulai dan Selesai')
+    ax.legend()
+    
+    # Rotasi label tanggal untuk keterbacaan
+    ax.tick_params(axis='x', labelrotation=45)
+
+
+def draw_task_overlap(ax, result):
+    """Grafik jumlah tugas aktif per hari dari hasil compute_task_overlap"""
+    # Jumlah tugas aktif per hari dari awal hingga akhir proyek
+    date_range = result['date_range']
+    active_tasks = result['active_tasks']
+    
+    # Bersihkan plot sebelumnya
+    ax.clear()
+    
+    # Plot line chart
+    ax.plot(date_range, active_tasks, 'b-', linewidth=2)
+    ax.fill_between(date_range, active_tasks, alpha=0.3)
+    
+    # Format x-axis sebagai tanggal
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    
+    # Tandai nilai tertinggi
+    max_index = result['max_index']
+    max_overlap = int(active_tasks[max_index])
+    max_date = date_range[max_index]
+    
+    ax.plot(max_date, max_overlap, 'ro')
+    ax.annotate(f'Puncak: {max_overlap} tugas\n{max_date.strftime("%Y-%m-%d")}',
+                xy=(max_date, max_overlap),
+                xytext=(max_date + timedelta(days=2), max_overlap + 1),
+                arrowprops=dict(facecolor='black', shrink=0.05, width=1.5),
+                fontweight='bold')
+    
+    # Tambahkan label dan judul
+    ax.set_xlabel('Tanggal')
+    ax.set_ylabel('Jumlah Tugas Aktif')
+    ax.set_title('Jumlah Tugas yang Berjalan Bersamaan')
+    
+    # Rotasi label tanggal untuk keterbacaan
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    # Format grid
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+
+def capture_view(fig, ax):
+    """Simpan ukuran, batas view, dan warna tampilan agar grafik bisa dirender ulang di figure lain"""
+    tick_labels = ax.xaxis.get_ticklabels()
+    return {
+        'size': tuple(fig.get_size_inches()),
+        'xlim': ax.get_xlim(),
+        'ylim': ax.get_ylim(),
+        'fig_facecolor': fig.get_facecolor(),
+        'ax_facecolor': ax.get_facecolor(),
+        'title_color': ax.title.get_color(),
+        'label_color': ax.xaxis.label.get_color(),
+        'tick_color': tick_labels[0].get_color() if tick_labels else None,
+    }
+
+
+def apply_view(fig, ax, view, limits=True):
+    """Terapkan hasil capture_view ke figure baru (tanpa batas view jika limits=False)"""
+    fig.set_facecolor(view['fig_facecolor'])
+    ax.set_facecolor(view['ax_facecolor'])
+    if limits:
+        ax.set_xlim(view['xlim'])
+        ax.set_ylim(view['ylim'])
+    ax.title.set_color(view['title_color'])
+    ax.xaxis.label.set_color(view['label_color'])
+    ax.yaxis.label.set_color(view['label_color'])
+    if view['tick_color'] is not None:
+        ax.tick_params(colors=view['tick_color'])
+
+
+def render_figure(draw, result, file_path, dpi=300, figsize=(10, 8), view=None, bbox_inches=None):
+    """Render satu grafik ke file dengan Figure dan canvas Agg sendiri (aman di luar thread GUI)"""
+    fig = Figure(figsize=view['size'] if view is not None else figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    
+    # Simpan nilai kembalian draw (misalnya GanttChart) selama figure dirender
+    chart = draw(ax, result)
+    if view is not None:
+        apply_view(fig, ax, view)
+    fig.tight_layout()
+    
+    # Format (PNG/PDF/SVG) ditentukan dari ekstensi file
+    fig.savefig(file_path, dpi=dpi, bbox_inches=bbox_inches)
+    return chart
+
+
+# Ukuran halaman A4 landscape (inci) untuk ekspor PDF multi-halaman
+PAGE_SIZE = (11.69, 8.27)
+
+
+def gantt_page_ranges(prepared, rows_per_page, time_windows=1):
+    """Bagi tugas menjadi pita baris, tiap pita opsional dibagi lagi per jendela waktu"""
+    lefts = prepared['lefts']
+    rights = lefts + prepared['widths']
+    pages = []
+    for row0 in range(0, len(lefts), rows_per_page):
+        row1 = min(row0 + rows_per_page, len(lefts))
+        
+        # Rentang waktu mengikuti tugas di pita ini agar bar tetap terbaca
+        x0 = lefts[row0:row1].min() - 1
+        x1 = rights[row0:row1].max() + 1
+        edges = np.linspace(x0, x1, time_windows + 1)
+        for window in range(time_windows):
+            pages.append((row0, row1, edges[window], edges[window + 1]))
+    return pages
+
+
+def export_gantt_pages(prepared, file_path, rows_per_page=25, time_windows=1,
+                       view=None, progress=None):
+    """Ekspor Gantt ke satu PDF multi-halaman, tiap halaman dirender lalu dibuang"""
+    pages = gantt_page_ranges(prepared, rows_per_page, time_windows)
+    n_tasks = len(prepared['tasks'])
+    
+    # Satu figure dipakai ulang untuk semua halaman; GanttChart hanya membuat bar
+    # untuk tugas di view sehingga memori per halaman tetap kecil. Axes diambil lewat
+    # chart agar referensinya hidup selama loop (callback xlim/ylim hanya weak reference)
+    fig = Figure(figsize=PAGE_SIZE)
+    FigureCanvasAgg(fig)
+    chart = draw_gantt(fig.add_subplot(), prepared)
+    ax = chart.ax
+    if view is not None:
+        apply_view(fig, ax, view, limits=False)
+    
+    with PdfPages(file_path) as pdf:
+        for number, (row0, row1, x0, x1) in enumerate(pages, 1):
+            if progress is not None:
+                progress(number - 1, len(pages), f"halaman {number}/{len(pages)}")
+            
+            ax.set_ylim(row0 - 0.75, row1 - 0.25)
+            ax.set_xlim(x0, x1)
+            ax.set_title(f'Gantt Chart - tugas {row0 + 1}-{row1} dari {n_tasks} '
+                         f'(halaman {number}/{len(pages)})')
+            fig.tight_layout()
+            pdf.savefig(fig)
+    
+    if progress is not None:
+        progress(len(pages), len(pages), "selesai")
+
+
+# Urutan halaman laporan: kunci hasil compute_report, judul, dan fungsi gambar
+REPORT_PAGES = [
+    ('gantt', "Gantt Chart", draw_gantt),
+    ('duration', "Durasi Tugas", draw_task_duration),
+    ('timeline', "Distribusi Timeline", draw_timeline_histogram),
+    ('overlap', "Overlap Tugas", draw_task_overlap),
+]
+
+
+def render_report(results, file_path, figsize=PAGE_SIZE, view=None, progress=None):
+    """Render hasil compute_report sebagai halaman-halaman satu file PDF"""
+    pages = [(title, draw, results[key]) for key, title, draw in REPORT_PAGES
+             if results.get(key) is not None]
+    
+    with PdfPages(file_path) as pdf:
+        for number, (title, draw, result) in enumerate(pages):
+            if progress is not None:
+                progress(number, len(pages), title)
+            
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            
+            # Batas view tidak diubah lagi, jadi bar Gantt yang terlihat sudah lengkap
+            draw(ax, result)
+            if view is not None:
+                apply_view(fig, ax, view, limits=False)
+            fig.tight_layout()
+            pdf.savefig(fig)
+    
+    if progress is not None:
+        progress(len(pages), len(pages), "selesai")
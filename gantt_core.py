@@ -0,0 +1,526 @@
+"""
+Inti perhitungan Gantt Chart dan analisis data (hanya pandas/NumPy, tanpa Qt dan matplotlib)
+
+Dipakai oleh GUI (mainrev02.py dan ProjectApp/GanttAnalysisApp.py) maupun dari skrip
+dan worker process, sehingga perhitungan tidak perlu memuat Qt atau matplotlib.
+"""
+
+import os
+import hashlib
+import tempfile
+import warnings
+from collections import OrderedDict
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+# Argumen format pd.to_datetime untuk menebak format tiap nilai (pandas < 2.0 melakukannya tanpa format)
+MIXED_FORMAT = 'mixed' if int(pd.__version__.split('.')[0]) >= 2 else None
+
+
+class ColumnTypeDetector:
+    """Deteksi kolom tanggal dari sampel terbatas dan simpan format tiap kolom"""
+    
+    # Jumlah nilai yang diuji per kolom
+    SAMPLE_SIZE = 200
+    
+    # Format cadangan jika pandas tidak bisa menebak format dari sampel
+    FALLBACK_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%Y/%m/%d',
+                        '%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M', '%d %b %Y', '%d %B %Y']
+    
+    # Penanda untuk kolom yang sudah bertipe datetime64
+    NATIVE = 'datetime64'
+    
+    # Penanda untuk kolom tanggal yang formatnya tidak seragam (format tiap nilai ditebak)
+    MIXED = 'mixed'
+    
+    def __init__(self):
+        self._formats = {}
+    
+    def date_format(self, series):
+        """Kembalikan format tanggal kolom, atau None jika kolom bukan tanggal"""
+        name = series.name
+        if name not in self._formats:
+            self._formats[name] = self._detect(series)
+        return self._formats[name]
+    
+    def is_date(self, series):
+        return self.date_format(series) is not None
+    
+    def to_datetime(self, series, errors='coerce'):
+        """Konversi kolom ke datetime memakai format yang sudah terdeteksi
+        
+        Jika format dari sampel tidak berlaku untuk seluruh kolom, format tersebut dibuang dan
+        format tiap nilai ditebak. Dengan errors='coerce' nilai yang tetap tidak terbaca menjadi NaT.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return series
+        date_format = self.date_format(series)
+        if date_format is None:
+            return pd.to_datetime(series)
+        if date_format != self.MIXED:
+            try:
+                return pd.to_datetime(series, format=date_format)
+            except (ValueError, TypeError, OverflowError):
+                self._formats[series.name] = self.MIXED
+        return pd.to_datetime(series, format=MIXED_FORMAT, errors=errors)
+    
+    def _detect(self, series):
+        """Uji sampel kolom terhadap format tanggal yang mungkin"""
+        dtype = series.dtype
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return self.NATIVE
+        if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            return None
+        
+        values = series.dropna()
+        if values.empty:
+            return None
+        
+        # Ambil sampel yang tersebar merata, bukan hanya baris teratas
+        if len(values) > self.SAMPLE_SIZE:
+            positions = np.linspace(0, len(values) - 1, self.SAMPLE_SIZE).astype(int)
+            values = values.iloc[positions]
+        sample = values.astype(str)
+        
+        # Kumpulkan kandidat format dari beberapa nilai pertama
+        candidates = []
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for value in sample.iloc[:5]:
+                guessed = guess_datetime_format(value)
+                if guessed and guessed not in candidates:
+                    candidates.append(guessed)
+        candidates += [fmt for fmt in self.FALLBACK_FORMATS if fmt not in candidates]
+        
+        for date_format in candidates:
+            try:
+                pd.to_datetime(sample, format=date_format)
+                return date_format
+            except (ValueError, TypeError, OverflowError):
+                continue
+        return None
+
+
+def convert_date_columns(df, detector):
+    """Konversi kolom teks yang berisi tanggal menjadi datetime64"""
+    for col in df.columns:
+        date_format = detector.date_format(df[col])
+        if date_format is None or date_format == detector.NATIVE:
+            continue
+        
+        try:
+            df[col] = detector.to_datetime(df[col], errors='raise')
+        except (ValueError, TypeError, OverflowError):
+            # Ada nilai yang bukan tanggal, biarkan sebagai teks
+            pass
+    return df
+
+
+class CsvCache:
+    """Cache biner kolumnar untuk CSV yang pernah dibuka (LRU berdasarkan ukuran)"""
+    
+    # Batas ukuran cache default dalam MB, bisa diubah lewat environment variable
+    DEFAULT_MAX_MB = 2048
+    
+    def __init__(self, cache_dir=None, max_bytes=None):
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                'GANTT_CACHE_DIR',
+                os.path.join(os.path.expanduser('~'), '.gantt_analysis_cache'))
+        if max_bytes is None:
+            max_mb = float(os.environ.get('GANTT_CACHE_MAX_MB', self.DEFAULT_MAX_MB))
+            max_bytes = int(max_mb * 1048576)
+        
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        
+        # Gunakan Feather (pyarrow) jika tersedia, jika tidak gunakan pickle
+        try:
+            import pyarrow  # noqa: F401
+            self.extension = '.feather'
+        except ImportError:
+            self.extension = '.pkl'
+    
+    def cache_path(self, file_path):
+        """Buat path cache berdasarkan path, ukuran, dan waktu modifikasi file"""
+        stat = os.stat(file_path)
+        key_source = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        key = hashlib.sha1(key_source.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + self.extension)
+    
+    def load(self, file_path):
+        """Muat DataFrame dari cache, kembalikan None jika tidak ada"""
+        if self.max_bytes <= 0:
+            return None
+        try:
+            path = self.cache_path(file_path)
+            if not os.path.exists(path):
+                return None
+            
+            if self.extension == '.feather':
+                df = pd.read_feather(path)
+            else:
+                df = pd.read_pickle(path)
+            
+            # Tandai sebagai baru dipakai untuk keperluan LRU
+            os.utime(path, None)
+            return df
+        except Exception:
+            return None
+    
+    def store(self, file_path, df):
+        """Simpan DataFrame ke cache lalu buang entri lama jika melebihi batas"""
+        if self.max_bytes <= 0:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self.cache_path(file_path)
+            
+            # Tulis ke file sementara dulu agar cache tidak pernah setengah jadi
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            os.close(fd)
+            try:
+                if self.extension == '.feather':
+                    df.reset_index(drop=True).to_feather(tmp_path)
+                else:
+                    df.to_pickle(tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            
+            self.evict()
+        except Exception:
+            pass
+    
+    def evict(self):
+        """Hapus entri yang paling lama tidak dipakai hingga ukuran di bawah batas"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(('.feather', '.pkl')):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+
+# Kata kunci nama kolom untuk menebak kolom Gantt Chart
+TASK_KEYWORDS = ['task', 'tugas', 'aktivitas', 'kegiatan', 'nama']
+START_KEYWORDS = ['start', 'mulai', 'begin', 'awal']
+END_KEYWORDS = ['end', 'finish', 'selesai', 'akhir']
+PROGRESS_KEYWORDS = ['progress', 'kemajuan', 'persen', 'percent', '%']
+
+
+def guess_task_columns(df, detector=None):
+    """Tebak kolom tugas, mulai, selesai, dan progress dari nama atau tipe data (None jika tidak ada)"""
+    if detector is None:
+        detector = ColumnTypeDetector()
+    
+    def find_column_by_keywords(keywords):
+        for col in df.columns:
+            col_lower = str(col).lower()
+            if any(keyword in col_lower for keyword in keywords):
+                return col
+        return None
+    
+    guessed = {
+        'task': find_column_by_keywords(TASK_KEYWORDS),
+        'start': None,
+        'end': None,
+        'progress': find_column_by_keywords(PROGRESS_KEYWORDS),
+    }
+    
+    # Prioritaskan kolom dengan tipe data datetime (deteksi berbasis sampel)
+    date_columns = [col for col in df.columns if detector.is_date(df[col])]
+    if len(date_columns) >= 2:
+        guessed['start'] = find_column_by_keywords(START_KEYWORDS) or date_columns[0]
+        guessed['end'] = find_column_by_keywords(END_KEYWORDS) or date_columns[1]
+    return guessed
+
+
+def read_task_csv(file_path, cache=None, detector=None):
+    """Baca CSV sekaligus (tanpa progres) dengan konversi tanggal dan cache biner opsional"""
+    if cache is not None:
+        df = cache.load(file_path)
+        if df is not None:
+            return df
+    
+    df = convert_date_columns(pd.read_csv(file_path), detector or ColumnTypeDetector())
+    if cache is not None:
+        cache.store(file_path, df)
+    return df
+
+
+def count_active_tasks(starts, ends):
+    """Hitung jumlah tugas aktif per hari dengan sweep-line (+1 saat mulai, -1 setelah selesai)"""
+    project_start = starts.min()
+    project_end = ends.max()
+    date_range = pd.date_range(start=project_start, end=project_end)
+    n_days = len(date_range)
+    
+    # Indeks hari pertama dan terakhir tugas aktif pada grid harian
+    day = np.timedelta64(1, 'D').astype('timedelta64[ns]').astype(np.int64)
+    start_offsets = (starts - project_start).astype('timedelta64[ns]').astype(np.int64)
+    end_offsets = (ends - project_start).astype('timedelta64[ns]').astype(np.int64)
+    first_day = -(-start_offsets // day)
+    last_day = end_offsets // day
+    
+    # Tugas yang selesai sebelum mulai tidak pernah aktif
+    valid = first_day <= last_day
+    first_day = first_day[valid]
+    last_day = np.minimum(last_day[valid], n_days - 1)
+    
+    events = (np.bincount(first_day, minlength=n_days + 1)[:n_days + 1]
+              - np.bincount(last_day + 1, minlength=n_days + 1)[:n_days + 1])
+    active_tasks = np.cumsum(events)[:n_days]
+    return date_range, active_tasks
+
+
+def top_n_longest(durations, n):
+    """Indeks n tugas terpanjang (urut menurun, urutan asli untuk durasi sama) tanpa sort penuh"""
+    n = min(n, len(durations))
+    if n <= 0:
+        return np.empty(0, dtype=int)
+    
+    # Nilai durasi terbesar ke-n lewat partial selection O(len)
+    threshold = np.partition(durations, len(durations) - n)[len(durations) - n]
+    above = np.flatnonzero(durations > threshold)
+    ties = np.flatnonzero(durations == threshold)[:n - len(above)]
+    selected = np.concatenate([above, ties])
+    
+    # Hanya n elemen terpilih yang diurutkan
+    return selected[np.lexsort((selected, -durations[selected]))]
+
+
+class TaskTable:
+    """Tampilan data tugas bertipe dan read-only yang dipakai bersama oleh semua grafik"""
+    
+    def __init__(self, df, task_col, start_col, end_col, progress_col=None, detector=None):
+        self.task_col = task_col
+        self.start_col = start_col
+        self.end_col = end_col
+        self.progress_col = progress_col
+        
+        # Konversi tanggal di salinan saja, DataFrame bersama tidak diubah
+        if detector is None:
+            detector = ColumnTypeDetector()
+        starts = detector.to_datetime(df[start_col])
+        ends = detector.to_datetime(df[end_col])
+        
+        # Abaikan baris yang tanggalnya kosong atau tidak terbaca; jumlahnya dilaporkan ke pengguna
+        valid = starts.notna().to_numpy() & ends.notna().to_numpy()
+        self.skipped_rows = int(len(valid) - valid.sum())
+        
+        self.tasks = df[task_col].to_numpy()[valid]
+        self.starts = starts.to_numpy(dtype='datetime64[ns]')[valid]
+        self.ends = ends.to_numpy(dtype='datetime64[ns]')[valid]
+        
+        # Durasi dalam hari (inklusif) dihitung sekali di sini
+        self.durations = (self.ends - self.starts) // np.timedelta64(1, 'D') + 1
+        
+        if progress_col:
+            self.progress = df[progress_col].to_numpy()[valid]
+        else:
+            self.progress = None
+        
+        for array in (self.tasks, self.starts, self.ends, self.durations, self.progress):
+            if array is not None:
+                array.flags.writeable = False
+    
+    def __len__(self):
+        return len(self.tasks)
+    
+    @property
+    def empty(self):
+        return len(self.tasks) == 0
+
+
+# Epoch default matplotlib (rcParams['date.epoch']), hasil sama dengan mdates.date2num
+DATE_EPOCH = np.datetime64('1970-01-01T00:00:00', 'ns')
+
+
+def date_to_num(values):
+    """Konversi datetime64 ke angka hari sejak epoch tanpa mengimpor matplotlib"""
+    values = np.asarray(values, dtype='datetime64[ns]')
+    return (values - DATE_EPOCH) / np.timedelta64(1, 'D')
+
+
+class TaskIntervalIndex:
+    """Indeks interval atas baris Gantt (urut tanggal mulai) untuk mencari tugas di dalam view"""
+    
+    def __init__(self, lefts, rights):
+        self.lefts = lefts
+        self.rights = rights
+        # Maksimum kumulatif tanggal selesai bersifat monoton sehingga bisa di-searchsorted
+        self.max_rights = np.maximum.accumulate(rights) if len(rights) else rights
+    
+    def query(self, x0, x1, row0, row1):
+        """Kembalikan indeks baris row0..row1 yang intervalnya beririsan dengan [x0, x1]"""
+        # Baris sebelum ini semuanya selesai sebelum x0
+        first = max(row0, int(np.searchsorted(self.max_rights, x0, side='left')))
+        # Baris setelah ini semuanya mulai setelah x1
+        last = min(row1, int(np.searchsorted(self.lefts, x1, side='right')))
+        if last <= first:
+            return np.empty(0, dtype=int)
+        
+        candidates = np.arange(first, last)
+        return candidates[self.rights[first:last] >= x0]
+
+
+def prepare_gantt(table):
+    """Siapkan geometri bar Gantt (urut tanggal mulai) dari TaskTable"""
+    if table.empty:
+        return None
+    
+    # Urutkan berdasarkan tanggal mulai
+    order = np.argsort(table.starts, kind='stable')
+    starts = table.starts[order]
+    ends = table.ends[order]
+    
+    # Posisi bar dalam satuan data, durasi sudah dihitung saat ingestion
+    durations = table.durations[order]
+    lefts = date_to_num(starts)
+    widths = durations.astype(float)
+    
+    return {
+        'tasks': table.tasks[order].tolist(),
+        'lefts': lefts,
+        'widths': widths,
+        'durations': durations,
+        'index': TaskIntervalIndex(lefts, lefts + widths),
+        'min_date': pd.Timestamp(starts.min()) - timedelta(days=1),
+        'max_date': pd.Timestamp(ends.max()) + timedelta(days=1),
+    }
+
+
+def compute_task_duration(table, top_n=10):
+    """Ambil top N tugas dengan durasi terpanjang"""
+    if table.empty:
+        return None
+    top = top_n_longest(table.durations, top_n)
+    return {'tasks': table.tasks[top], 'durations': table.durations[top]}
+
+
+def compute_timeline_histogram(table, bins=10):
+    """Hitung histogram tanggal mulai dan selesai dengan bin yang sama"""
+    if table.empty:
+        return None
+    starts = date_to_num(table.starts)
+    ends = date_to_num(table.ends)
+    
+    # Bin bersama seperti ax.hist untuk beberapa dataset sekaligus
+    edges = np.histogram_bin_edges(np.concatenate([starts, ends]), bins)
+    return {
+        'edges': edges,
+        'start_counts': np.histogram(starts, edges)[0],
+        'end_counts': np.histogram(ends, edges)[0],
+    }
+
+
+def compute_task_overlap(table):
+    """Hitung jumlah tugas aktif per hari beserta puncaknya"""
+    if table.empty:
+        return None
+    date_range, active_tasks = count_active_tasks(table.starts, table.ends)
+    max_index = int(np.argmax(active_tasks))
+    return {
+        'date_range': date_range,
+        'active_tasks': active_tasks,
+        'max_index': max_index,
+    }
+
+
+def compute_report(table, top_n=10):
+    """Hitung Gantt dan ketiga analisis sekaligus dari satu TaskTable"""
+    return {
+        'gantt': prepare_gantt(table),
+        'duration': compute_task_duration(table, top_n),
+        'timeline': compute_timeline_histogram(table),
+        'overlap': compute_task_overlap(table),
+    }
+
+
+def data_fingerprint(df):
+    """Hash isi DataFrame (nilai dan nama kolom) untuk kunci cache analisis"""
+    digest = hashlib.sha1()
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """Cache LRU hasil analisis dengan batas memori"""
+    
+    # Batas memori default untuk hasil analisis yang disimpan
+    DEFAULT_MAX_BYTES = 256 * 1048576
+    
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+    
+    def lookup(self, key):
+        """Kembalikan (ditemukan, hasil) tanpa menghitung ulang"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[0]
+    
+    def store(self, key, result):
+        """Simpan hasil analisis, entri terlama dibuang jika melebihi batas"""
+        if key in self._entries:
+            self._total_bytes -= self._entries.pop(key)[1]
+        size = self._estimate_bytes(result)
+        if size <= self.max_bytes:
+            self._entries[key] = (result, size)
+            self._total_bytes += size
+            self._evict()
+    
+    def get_or_compute(self, key, compute):
+        """Kembalikan hasil dari cache, atau hitung lalu simpan jika belum ada"""
+        found, result = self.lookup(key)
+        if not found:
+            result = compute()
+            self.store(key, result)
+        return result
+    
+    def clear(self):
+        self._entries.clear()
+        self._total_bytes = 0
+    
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+    
+    @staticmethod
+    def _estimate_bytes(result):
+        """Perkiraan ukuran hasil: array NumPy/pandas dihitung dari nbytes-nya"""
+        if result is None:
+            return 0
+        size = 0
+        for value in result.values():
+            if isinstance(value, TaskIntervalIndex):
+                size += value.lefts.nbytes + value.rights.nbytes + value.max_rights.nbytes
+            elif hasattr(value, 'nbytes'):
+                size += value.nbytes
+            elif isinstance(value, list):
+                size += 64 * len(value)
+            else:
+                size += 64
+        return size
@@ -0,0 +1,123 @@
+"""
+Konfigurasi matplotlib untuk aplikasi hasil build (PyInstaller / cx_Freeze)
+
+Saat build, build_mpl_config() membuat folder berisi cache font matplotlib dan style tema
+terang/gelap yang dipakai toggle_theme. Saat runtime, configure_matplotlib() mengarahkan
+MPLCONFIGDIR ke folder tersebut sehingga grafik pertama tidak menunggu matplotlib membangun
+ulang cache font. matplotlib hanya diimpor di dalam fungsi yang membutuhkannya.
+"""
+
+import copy
+import os
+import shutil
+import sys
+
+# Nama folder konfigurasi di dalam bundle
+MPL_CONFIG_DIR = 'mpl_config'
+
+# File style per tema di folder konfigurasi
+THEME_STYLES = {'light': 'gantt_light.mplstyle', 'dark': 'gantt_dark.mplstyle'}
+# Style bawaan matplotlib yang dipakai jika aplikasi dijalankan dari source
+BUILTIN_STYLES = {'light': 'default', 'dark': 'dark_background'}
+
+
+def bundled_config_dir():
+    """Folder konfigurasi matplotlib di dalam bundle, None jika dijalankan dari source"""
+    if not getattr(sys, 'frozen', False):
+        return None
+    # PyInstaller menyimpan data di sys._MEIPASS, cx_Freeze di folder executable
+    base = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
+    path = os.path.join(base, MPL_CONFIG_DIR)
+    return path if os.path.isdir(path) else None
+
+
+def configure_matplotlib():
+    """Arahkan MPLCONFIGDIR ke folder konfigurasi bundle (panggil sebelum matplotlib diimpor)
+
+    Kembalikan folder yang dipakai, atau None jika tidak ada yang diubah.
+    """
+    source = bundled_config_dir()
+    if source is None or 'MPLCONFIGDIR' in os.environ:
+        return None
+
+    config_dir = source
+    if not os.access(source, os.W_OK):
+        # matplotlib mengabaikan MPLCONFIGDIR yang tidak bisa ditulisi (misalnya one-dir
+        # di Program Files), jadi isinya disalin ke folder milik pengguna
+        config_dir = os.path.join(os.path.expanduser('~'), '.gantt_analysis_cache', MPL_CONFIG_DIR)
+        try:
+            shutil.copytree(source, config_dir, dirs_exist_ok=True)
+        except OSError:
+            return None
+
+    os.environ['MPLCONFIGDIR'] = config_dir
+    return config_dir
+
+
+def theme_style(dark):
+    """Style matplotlib untuk tema: file style dari bundle jika ada, selain itu style bawaan"""
+    theme = 'dark' if dark else 'light'
+    source = bundled_config_dir()
+    if source is not None:
+        path = os.path.join(source, THEME_STYLES[theme])
+        if os.path.isfile(path):
+            return path
+    return BUILTIN_STYLES[theme]
+
+
+def builtin_theme_rc(dark):
+    """rcParams tema dari style bawaan: dark_background, atau nilai default untuk kunci yang sama"""
+    import matplotlib as mpl
+    from matplotlib import style
+
+    dark_rc = style.library[BUILTIN_STYLES['dark']]
+    if dark:
+        return dict(dark_rc)
+    return {key: mpl.rcParamsDefault[key] for key in dark_rc}
+
+
+def theme_rc(dark):
+    """rcParams tema: dari file style bundle jika ada, selain itu dari style bawaan"""
+    import matplotlib as mpl
+
+    path = theme_style(dark)
+    if path != BUILTIN_STYLES['dark' if dark else 'light']:
+        return dict(mpl.rc_params_from_file(path, use_default_template=False))
+    return builtin_theme_rc(dark)
+
+
+def format_rc_value(value):
+    """Tulis nilai rcParams dalam format file .mplstyle"""
+    from matplotlib.colors import to_hex
+
+    # '#' dibaca sebagai awal komentar, jadi warna hex ditulis tanpa '#' seperti di stylelib matplotlib
+    if hasattr(value, 'by_key'):
+        colors = ', '.join(repr(to_hex(color)[1:]) for color in value.by_key()['color'])
+        return f"cycler('color', [{colors}])"
+    text = str(value)
+    return text[1:] if text.startswith('#') else text
+
+
+def build_mpl_config(target_dir):
+    """Buat cache font dan file style tema di target_dir (dipanggil saat build)"""
+    import matplotlib as mpl
+    from matplotlib import font_manager
+
+    os.makedirs(target_dir, exist_ok=True)
+
+    # Hanya font bawaan matplotlib yang disimpan: path-nya ditulis relatif terhadap folder data
+    # matplotlib sehingga tetap valid di komputer lain dan di folder ekstraksi one-file
+    data_path = os.path.join(os.path.abspath(mpl.get_data_path()), '')
+    manager = copy.copy(font_manager.fontManager)
+    manager.ttflist = [f for f in manager.ttflist if os.path.abspath(f.fname).startswith(data_path)]
+    manager.afmlist = [f for f in manager.afmlist if os.path.abspath(f.fname).startswith(data_path)]
+    cache_file = os.path.join(target_dir, f"fontlist-v{font_manager.FontManager.__version__}.json")
+    font_manager.json_dump(manager, cache_file)
+
+    for theme in THEME_STYLES:
+        params = builtin_theme_rc(theme == 'dark')
+        with open(os.path.join(target_dir, THEME_STYLES[theme]), 'w', encoding='utf-8') as f:
+            for key in sorted(params):
+                f.write(f"{key}: {format_rc_value(params[key])}\n")
+
+    return target_dir
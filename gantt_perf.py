@@ -0,0 +1,251 @@
+"""
+Pencatatan waktu per tahap (load, parse, compute, plot, layout, draw, export) untuk jendela Performa
+
+PerfTracer nonaktif secara default. Saat nonaktif begin() mengembalikan operasi kosong yang
+stage()-nya tidak mengukur apa pun, sehingga kode yang diinstrumentasi tidak terbebani.
+Aktifkan dengan environment variable GANTT_PERF=1 atau dari menu Tampilan > Performa.
+
+Operasi yang selesai juga bisa ditulis ke log lokal JSON Lines (PerfLog, opt-in dengan
+GANTT_PERF_LOG=1 atau dari jendela Performa) untuk diringkas dengan gantt_perf_report.py.
+Modul ini hanya memakai pustaka standar agar bisa diimpor sebelum jendela utama tampil.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+
+# Urutan tahap yang ditampilkan di jendela Performa
+STAGES = ('load', 'parse', 'compute', 'plot', 'layout', 'draw', 'export')
+
+# Versi aplikasi yang ditulis ke setiap record log (juga dipakai setup.py)
+APP_VERSION = '1.0'
+
+# Nama file log performa; file lama hasil rotasi diberi akhiran .1, .2, ...
+PERF_LOG_FILE = 'perf_log.jsonl'
+
+
+def peak_memory():
+    """Puncak pemakaian memori (RSS) proses sejauh ini dalam byte, None jika tidak didukung"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+                    (name, ctypes.c_size_t) for name in (
+                        'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage',
+                        'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage',
+                        'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+
+            kernel32 = ctypes.WinDLL('kernel32')
+            psapi = ctypes.WinDLL('psapi')
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE,
+                                                   ctypes.POINTER(ProcessMemoryCounters),
+                                                   wintypes.DWORD]
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(),
+                                              ctypes.byref(counters), counters.cb):
+                return None
+            return counters.PeakWorkingSetSize
+
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss dalam byte di macOS, dalam KB di Linux
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except (ImportError, OSError, AttributeError):
+        return None
+
+
+class _NullStage:
+    """Context manager kosong untuk tahap saat tracer nonaktif"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Stage:
+    """Context manager yang menambahkan durasi blok ke tahap sebuah operasi"""
+
+    def __init__(self, operation, name):
+        self.operation = operation
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.operation.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class NullOperation:
+    """Operasi saat tracer nonaktif: semua pemanggilan diabaikan"""
+
+    _STAGE = _NullStage()
+
+    def stage(self, name):
+        return self._STAGE
+
+    def add(self, name, seconds):
+        pass
+
+    def annotate(self, **info):
+        pass
+
+    def finish(self, rows=None, status='selesai'):
+        pass
+
+
+NULL_OPERATION = NullOperation()
+
+
+class Operation:
+    """Satu operasi (misalnya memuat CSV atau menggambar Gantt) beserta waktu tiap tahapnya
+
+    Tahap boleh diukur di thread mana pun; finish() dipanggil di thread GUI.
+    """
+
+    def __init__(self, tracer, name, detail=''):
+        self.tracer = tracer
+        self.name = name
+        self.detail = detail
+        self.rows = None
+        self.info = {}
+        self.stages = {}    # tahap -> detik, dijumlahkan jika tahap yang sama terjadi berulang
+        self.timestamp = time.time()
+        self.start = time.perf_counter()
+        self.peak_before = peak_memory()
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """Context manager untuk mengukur satu tahap"""
+        return _Stage(self, name)
+
+    def add(self, name, seconds):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def annotate(self, **info):
+        """Tambahkan data ke catatan operasi (misalnya ukuran file, jumlah kolom, hasil dari cache)"""
+        self.info.update(info)
+
+    def finish(self, rows=None, status='selesai'):
+        """Catat operasi ke riwayat tracer"""
+        if rows is not None:
+            self.rows = rows
+        peak = peak_memory()
+        growth = None
+        if peak is not None and self.peak_before is not None:
+            growth = peak - self.peak_before
+        self.tracer.record({
+            'timestamp': self.timestamp,
+            'operation': self.name,
+            'detail': self.detail,
+            'status': status,
+            'rows': self.rows,
+            'stages': dict(self.stages),
+            'total': time.perf_counter() - self.start,
+            'peak_memory': peak,
+            'memory_growth': growth,
+            **self.info,
+        })
+
+
+def perf_log_path():
+    """Path log performa: GANTT_PERF_LOG_FILE, atau di folder cache aplikasi milik pengguna"""
+    path = os.environ.get('GANTT_PERF_LOG_FILE')
+    if path:
+        return path
+    cache_dir = os.environ.get('GANTT_CACHE_DIR',
+                               os.path.join(os.path.expanduser('~'), '.gantt_analysis_cache'))
+    return os.path.join(cache_dir, PERF_LOG_FILE)
+
+
+class PerfLog:
+    """Log performa lokal dalam format JSON Lines (satu record per operasi) dengan rotasi ukuran
+
+    Jika file akan melebihi max_bytes, file diganti nama menjadi .1 (yang lama bergeser ke .2,
+    dan seterusnya) dan hanya `backups` file lama yang disimpan, sehingga ukuran log terbatas.
+    """
+
+    # Batas ukuran satu file log default dalam KB, bisa diubah lewat environment variable
+    DEFAULT_MAX_KB = 1024
+    DEFAULT_BACKUPS = 3
+
+    def __init__(self, path=None, max_bytes=None, backups=DEFAULT_BACKUPS):
+        if max_bytes is None:
+            max_kb = float(os.environ.get('GANTT_PERF_LOG_MAX_KB', self.DEFAULT_MAX_KB))
+            max_bytes = int(max_kb * 1024)
+        self.path = path or perf_log_path()
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def write(self, record):
+        """Tambahkan satu record ke log; kegagalan menulis tidak mengganggu aplikasi"""
+        record = {'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record['timestamp'])),
+                  'version': APP_VERSION, **record}
+        data = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            if size and size + len(data) > self.max_bytes:
+                self.rotate()
+            with open(self.path, 'ab') as f:
+                f.write(data)
+        except OSError:
+            pass
+
+    def rotate(self):
+        """Geser file log lama (.1 -> .2, ...) dan mulai file baru"""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+class PerfTracer:
+    """Riwayat operasi terbaru; pendengar dipanggil setiap ada operasi yang selesai"""
+
+    def __init__(self, enabled=None, history=200, log=None):
+        # GANTT_PERF_LOG=1 menulis log performa sejak aplikasi dibuka (dan mengaktifkan tracer)
+        if log is None and os.environ.get('GANTT_PERF_LOG') == '1':
+            log = PerfLog()
+        if enabled is None:
+            enabled = log is not None or os.environ.get('GANTT_PERF') == '1'
+        self.enabled = enabled
+        self.log = log
+        self.records = deque(maxlen=history)
+        self.listeners = []
+
+    def begin(self, name, detail=''):
+        """Mulai operasi baru, atau operasi kosong jika tracer nonaktif"""
+        if not self.enabled:
+            return NULL_OPERATION
+        return Operation(self, name, detail)
+
+    def record(self, record):
+        self.records.append(record)
+        if self.log is not None:
+            self.log.write(record)
+        for listener in self.listeners:
+            listener(record)
+
+    def clear(self):
+        self.records.clear()
@@ -0,0 +1,173 @@
+"""
+Ringkas log performa (perf_log.jsonl) yang ditulis aplikasi untuk membandingkan lokasi pengguna
+
+Setiap argumen dianggap satu lokasi: file log, pola glob, atau folder berisi perf_log.jsonl
+beserta file hasil rotasinya (.1, .2, ...). Untuk tiap lokasi dan jenis operasi dicetak jumlah
+operasi serta persentil durasi total, durasi tiap tahap, jumlah baris, ukuran file, dan memori puncak.
+Tanpa argumen, log milik pengguna saat ini yang diringkas. Jika tidak ada console (executable GUI),
+ringkasan ditulis ke perf_report.txt di folder log tersebut.
+Contoh:
+    python gantt_perf_report.py
+    python gantt_perf_report.py ~/.gantt_analysis_cache
+    python gantt_perf_report.py lokasi_a/perf_log.jsonl lokasi_b/ -p 50 90 99
+    python mainrev02.py --perf-report lokasi_a/ lokasi_b/ --json ringkasan.json
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import math
+import os
+import sys
+
+from gantt_perf import PERF_LOG_FILE, STAGES, perf_log_path
+
+
+DEFAULT_PERCENTILES = [50, 90, 95]
+
+# File ringkasan jika tidak ada console untuk mencetak (misalnya executable cx_Freeze Win32GUI)
+REPORT_TEXT_FILE = 'perf_report.txt'
+
+# Metrik yang diringkas: (nama, fungsi pengambil nilai dari record, pembagi untuk satuan tampilan)
+METRICS = ([('total (ms)', lambda r: r.get('total'), 1e-3)]
+           + [(f"{stage} (ms)", lambda r, stage=stage: r.get('stages', {}).get(stage), 1e-3)
+              for stage in STAGES]
+           + [('baris', lambda r: r.get('rows'), 1),
+              ('kolom', lambda r: r.get('columns'), 1),
+              ('ukuran file (MB)', lambda r: r.get('file_size'), 1048576),
+              ('memori puncak (MB)', lambda r: r.get('peak_memory'), 1048576)])
+
+
+def find_log_files(item):
+    """File log sebuah lokasi, urut dari yang terlama (file rotasi bernomor besar lebih dulu)"""
+    if os.path.isdir(item):
+        base = os.path.join(item, PERF_LOG_FILE)
+        rotated = [path for path in glob.glob(glob.escape(base) + '.*')
+                   if path.rsplit('.', 1)[-1].isdigit()]
+        rotated.sort(key=lambda path: int(path.rsplit('.', 1)[-1]), reverse=True)
+        return rotated + ([base] if os.path.isfile(base) else [])
+    if glob.has_magic(item):
+        return sorted(glob.glob(item))
+    return [item]
+
+
+def read_records(files):
+    """Baca semua record; baris rusak (misalnya terpotong saat aplikasi ditutup paksa) dilewati"""
+    records = []
+    skipped = 0
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    skipped += 1
+    return records, skipped
+
+
+def percentile(values, p):
+    """Persentil metode nearest-rank (selalu salah satu nilai yang teramati)"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(records, percentiles):
+    """Ringkasan per jenis operasi; durasi hanya dari operasi yang selesai"""
+    groups = {}
+    for record in records:
+        groups.setdefault(record.get('operation', '?'), []).append(record)
+
+    summary = {}
+    for operation, group in groups.items():
+        done = [r for r in group if r.get('status') == 'selesai']
+        metrics = {}
+        for name, getter, scale in METRICS:
+            values = [getter(r) for r in done]
+            values = [v / scale for v in values if v is not None]
+            if values:
+                metrics[name] = {**{f"p{p:g}": percentile(values, p) for p in percentiles},
+                                 'maks': max(values)}
+        summary[operation] = {
+            'count': len(group),
+            'done': len(done),
+            'failed': sum(1 for r in group if r.get('status') == 'gagal'),
+            'cached': sum(1 for r in done if r.get('cached')),
+            'versions': sorted({str(r.get('version', '?')) for r in group}),
+            'metrics': metrics,
+        }
+    return summary
+
+
+def print_site(label, files, skipped, summary):
+    print(f"== {label} ({len(files)} file log"
+          + (f", {skipped} baris rusak dilewati" if skipped else "") + ")")
+    if not summary:
+        print("   Tidak ada record")
+        return
+    for operation, info in sorted(summary.items()):
+        print(f"\n{operation}: {info['done']} selesai, {info['failed']} gagal, "
+              f"{info['cached']} dari cache (versi {', '.join(info['versions'])})")
+        if not info['metrics']:
+            continue
+        columns = list(next(iter(info['metrics'].values())))
+        print(f"   {'metrik':<20}" + ''.join(f"{column:>12}" for column in columns))
+        for name, values in info['metrics'].items():
+            print(f"   {name:<20}" + ''.join(f"{values[column]:>12,.1f}" for column in columns))
+    print()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Ringkas log performa JSON Lines per lokasi")
+    parser.add_argument('inputs', nargs='*', default=[os.path.dirname(perf_log_path())],
+                        help="Folder log, pola glob, atau file perf_log.jsonl "
+                             "(default: log pengguna saat ini)")
+    parser.add_argument('-p', '--percentiles', type=float, nargs='+', default=DEFAULT_PERCENTILES,
+                        help="Persentil yang dihitung (default: 50 90 95)")
+    parser.add_argument('--json', dest='json_path', help="Tulis ringkasan ke file JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    if sys.stdout is not None:
+        return run_report(argv)
+
+    # Executable GUI tidak punya console: semua cetakan dialihkan ke file di folder log
+    folder = os.path.dirname(perf_log_path())
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, REPORT_TEXT_FILE), 'w', encoding='utf-8') as f:
+        with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+            try:
+                return run_report(argv)
+            except SystemExit as e:
+                # Argumen tidak valid: pesan argparse sudah tertulis ke file
+                return e.code
+
+
+def run_report(argv=None):
+    args = parse_args(argv)
+    report = {}
+    for item in args.inputs:
+        files = [path for path in find_log_files(item) if os.path.isfile(path)]
+        if not files:
+            print(f"Log tidak ditemukan: {item}", file=sys.stderr)
+            continue
+        records, skipped = read_records(files)
+        summary = summarize(records, args.percentiles)
+        report[item] = summary
+        print_site(item, files, skipped, summary)
+
+    if not report:
+        return 1
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Ringkasan: {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Tema terang/gelap untuk grafik matplotlib yang sudah tergambar (tanpa Qt dan pyplot)
+
+Palet tiap tema dikompilasi sekali menjadi warna RGBA dan rcParams. Saat tema diganti, artist
+yang sudah ada (figure, axes, teks, legend, patch, garis, collection) diwarnai ulang di tempat,
+sehingga grafik tidak perlu dihitung dan digambar ulang dari awal; pemanggil cukup
+menggambar canvas satu kali. Warna eksplisit (misalnya bar viridis Gantt) tidak diubah.
+"""
+
+import numpy as np
+import matplotlib
+from matplotlib.collections import Collection
+from matplotlib.colors import to_rgba, to_rgba_array
+
+from gantt_mplconfig import theme_rc
+
+
+THEMES = ('light', 'dark')
+
+# Warna latar figure dan axes per tema, menimpa warna latar dari style
+BACKGROUNDS = {
+    'light': {'figure.facecolor': 'white', 'axes.facecolor': 'white'},
+    'dark': {'figure.facecolor': '#2b2b2b', 'axes.facecolor': '#3c3c3c'},
+}
+
+
+class ThemePalette:
+    """Warna satu tema dalam bentuk RGBA siap pakai, beserta rcParams untuk grafik baru"""
+
+    def __init__(self, name):
+        self.name = name
+        self.rc = {**theme_rc(name == 'dark'), **BACKGROUNDS[name]}
+        self.figure = to_rgba(self.rc['figure.facecolor'])
+        self.axes = to_rgba(self.rc['axes.facecolor'])
+        self.edge = to_rgba(self.rc['axes.edgecolor'])
+        self.text = to_rgba(self.rc['text.color'])
+        self.label = to_rgba(self.rc['axes.labelcolor'])
+        self.tick = to_rgba(self.rc['xtick.color'])
+        self.grid = to_rgba(self.rc['grid.color'])
+        self.patch_edge = to_rgba(self.rc['patch.edgecolor'])
+        self.cycle = to_rgba_array(self.rc['axes.prop_cycle'].by_key()['color'])
+
+
+def map_colors(colors, pairs):
+    """Ganti warna yang RGB-nya cocok dengan pasangan (lama, baru), alpha dipertahankan
+
+    Kembalikan array RGBA baru, atau None jika tidak ada warna yang berubah.
+    """
+    colors = to_rgba_array(colors).copy()
+    if len(colors) == 0:
+        return None
+
+    # Semua kecocokan dicari dari warna asli agar warna baru tidak dipetakan lagi
+    matches = [(np.all(np.abs(colors[:, :3] - old[:3]) < 1e-3, axis=1), new) for old, new in pairs]
+    changed = False
+    for match, new in matches:
+        if match.any():
+            colors[match, :3] = new[:3]
+            changed = True
+    return colors if changed else None
+
+
+def recolor_artist(artist, pairs, properties=None):
+    """Petakan warna face/edge (patch, collection) atau warna garis/teks jika berasal dari palet lama"""
+    if properties is None:
+        properties = ('facecolor', 'edgecolor') if hasattr(artist, 'get_facecolor') else ('color',)
+    for name in properties:
+        colors = map_colors(getattr(artist, 'get_' + name)(), pairs)
+        if colors is not None:
+            # Collection menyimpan satu warna per elemen, artist lain satu warna
+            getattr(artist, 'set_' + name)(colors if isinstance(artist, Collection) else colors[0])
+
+
+def apply_theme(fig, source, target):
+    """Warnai ulang figure yang memakai palet source menjadi palet target (tanpa menggambar)"""
+    series = list(zip(source.cycle, target.cycle))
+    text = [(source.text, target.text)]
+    patch_edge = [(source.patch_edge, target.patch_edge)]
+
+    fig.patch.set_facecolor(target.figure)
+    for ax in fig.axes:
+        ax.set_facecolor(target.axes)
+        for spine in ax.spines.values():
+            spine.set_edgecolor(target.edge)
+
+        # Berlaku juga untuk tick yang dibuat nanti saat zoom/pan; warna grid tanpa alpha
+        # karena alpha pada warna menimpa alpha grid dari ax.grid(alpha=...)
+        ax.tick_params(colors=target.tick, grid_color=target.grid[:3])
+        for axis in (ax.xaxis, ax.yaxis):
+            axis.label.set_color(target.label)
+            axis.get_offset_text().set_color(target.tick)
+        ax.title.set_color(target.text)
+
+        # Teks tambahan (nilai bar, anotasi puncak) hanya jika warnanya warna teks tema
+        for artist in ax.texts:
+            recolor_artist(artist, text)
+            # Tepi panah anotasi mengikuti patch.edgecolor, isi panah berwarna eksplisit
+            if getattr(artist, 'arrow_patch', None) is not None:
+                recolor_artist(artist.arrow_patch, patch_edge, ('edgecolor',))
+
+        # Warna seri dari siklus warna tema (histogram, area fill_between)
+        for artist in [*ax.patches, *ax.lines, *ax.collections]:
+            recolor_artist(artist, series)
+
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.get_frame().set_facecolor(target.axes)
+            for artist in legend.get_texts():
+                recolor_artist(artist, text)
+            for artist in legend.legend_handles:
+                recolor_artist(artist, series)
+
+
+class ThemeEngine:
+    """Palet semua tema yang sudah dikompilasi dan tema yang sedang aktif"""
+
+    def __init__(self, theme='light'):
+        self.palettes = {name: ThemePalette(name) for name in THEMES}
+        self.theme = theme
+
+    def set_theme(self, theme, figures):
+        """Ganti tema: rcParams untuk grafik baru, dan warnai ulang figure yang sudah ada"""
+        source = self.palettes[self.theme]
+        target = self.palettes[theme]
+        matplotlib.rcParams.update(target.rc)
+        for fig in figures:
+            apply_theme(fig, source, target)
+        self.theme = theme
@@ -1,265 +1,520 @@
 import sys
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from datetime import datetime, timedelta
+from datetime import datetime
+import os
+import bisect
+import multiprocessing
+import threading
+from collections import OrderedDict
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QTableView, QTabWidget, 
-                             QComboBox, QMessageBox, QSplitter, QGroupBox, QFormLayout)
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSize
+                             QComboBox, QMessageBox, QSplitter, QGroupBox, QFormLayout,
+                             QProgressBar, QSpinBox, QInputDialog, QDialog, QCheckBox,
+                             QTableWidget, QTableWidgetItem)
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QSize, QObject, QThread,
+                          QRunnable, QThreadPool, pyqtSignal)
 from PyQt6.QtGui import QAction, QIcon
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from PyQt6.QtGui import QAction, QIcon, QPalette, QColor
+from gantt_mplconfig import configure_matplotlib
+from gantt_perf import NULL_OPERATION, STAGES, PerfLog, PerfTracer
+
+# pandas, matplotlib, gantt_core, gantt_charts, dan gantt_canvas diimpor di dalam fungsi
+# yang memakainya agar jendela utama tampil tanpa menunggu modul-modul berat tersebut
 
 
 class PandasModel(QAbstractTableModel):
     """Model untuk menampilkan DataFrame di QTableView"""
     
-    def __init__(self, data):
+    # Jumlah baris yang diformat sekaligus per kolom
+    BLOCK_ROWS = 256
+    # Jumlah blok teks terformat yang disimpan (LRU)
+    MAX_CACHED_BLOCKS = 512
+    # Jumlah baris yang ditampilkan ke view setiap kali fetchMore dipanggil
+    FETCH_BATCH = 1000
+    # Format kolom tanggal, sama dengan str(Timestamp); pecahan detik hanya jika ada di kolom
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    DATE_FORMAT_FRACTION = '%Y-%m-%d %H:%M:%S.%f'
+    
+    def __init__(self, data, initial_rows=None):
         super().__init__()
         self._data = data
+        self._headers = [str(col) for col in data.columns]
+        self._blocks = OrderedDict()
+        self._date_formats = {}
+        
+        # Data disimpan per segmen (satu segmen per chunk CSV), masing-masing
+        # berupa array NumPy per kolom agar tidak melewati iloc untuk tiap sel
+        self._segments = []
+        self._offsets = [0]
+        self._add_segment(data)
+        
+        # Baris yang sudah diekspos ke view, sisanya diambil lewat fetchMore
+        if initial_rows is None:
+            initial_rows = self.FETCH_BATCH
+        self._loaded_rows = min(max(initial_rows, self.FETCH_BATCH), self._offsets[-1])
 
     def rowCount(self, parent=QModelIndex()):
-        return self._data.shape[0]
+        if parent.isValid():
+            return 0
+        return self._loaded_rows
 
     def columnCount(self, parent=QModelIndex()):
-        return self._data.shape[1]
+        if parent.isValid():
+            return 0
+        return len(self._headers)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
-            value = self._data.iloc[index.row(), index.column()]
-            return str(value)
+            row = index.row()
+            block = row // self.BLOCK_ROWS
+            strings = self._formatted_block(index.column(), block)
+            return strings[row - block * self.BLOCK_ROWS]
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
             if orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[section])
+                return self._headers[section]
             if orientation == Qt.Orientation.Vertical:
                 return str(section + 1)
         return None
-
-
-class GanttChartCanvas(FigureCanvas):
-    """Widget untuk menampilkan Gantt Chart"""
     
-    def __init__(self, parent=None, width=10, height=8, dpi=100):
-        self.fig, self.ax = plt.subplots(figsize=(width, height), dpi=dpi)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.fig.tight_layout()
-        
-    def plot_gantt(self, df, task_col, start_col, end_col, progress_col=None):
-        """Membuat Gantt chart dari DataFrame"""
-        if df.empty:
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded_rows < self._offsets[-1]
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Tampilkan batch baris berikutnya ke view"""
+        if parent.isValid():
             return
-            
-        # Konversi kolom tanggal jika perlu
-        for col in [start_col, end_col]:
-            if df[col].dtype != 'datetime64[ns]':
-                df[col] = pd.to_datetime(df[col])
-                
-        # Urutkan berdasarkan tanggal mulai
-        df = df.sort_values(by=start_col)
-        
-        # Siapkan data untuk plotting
-        tasks = df[task_col].tolist()
-        starts = df[start_col].tolist()
-        ends = df[end_col].tolist()
-        
-        # Hitung durasi
-        durations = [(end - start).days + 1 for start, end in zip(starts, ends)]
-        
-        # Bersihkan plot sebelumnya
-        self.ax.clear()
-        
-        # Atur y-axis
-        y_positions = range(len(tasks))
-        self.ax.set_yticks(y_positions)
-        self.ax.set_yticklabels(tasks)
-        
-        # Plot bars
-        colors = plt.cm.viridis(np.linspace(0, 1, len(tasks)))
-        for i, (task, start, duration) in enumerate(zip(tasks, starts, durations)):
-            self.ax.barh(i, duration, left=mdates.date2num(start), height=0.5, 
-                         color=colors[i], edgecolor='black', alpha=0.8)
-                         
-            # Tambahkan teks durasi
-            self.ax.text(mdates.date2num(start) + duration/2, i, f"{duration} hari", 
-                         ha='center', va='center', color='white', fontweight='bold')
-        
-        # Format x-axis sebagai tanggal
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        
-        # Atur batasan x-axis
-        if starts and ends:
-            min_date = min(starts) - timedelta(days=1)
-            max_date = max(ends) + timedelta(days=1)
-            self.ax.set_xlim(min_date, max_date)
-        
-        # Tambahkan label dan judul
-        self.ax.set_xlabel('Tanggal')
-        self.ax.set_ylabel('Tugas')
-        self.ax.set_title('Gantt Chart')
-        
-        # Rotasi label tanggal untuk keterbacaan
-        plt.xticks(rotation=45)
-        
-        # Format grid
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-        
-        self.fig.tight_layout()
-        self.draw()
-
-
-class AnalysisCanvas(FigureCanvas):
-    """Widget untuk menampilkan visualisasi analisis data"""
-    
-    def __init__(self, parent=None, width=10, height=8, dpi=100):
-        self.fig, self.ax = plt.subplots(figsize=(width, height), dpi=dpi)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.fig.tight_layout()
-
-    def plot_task_duration(self, df, task_col, start_col, end_col):
-        """Membuat grafik durasi tugas"""
-        if df.empty:
+        remaining = self._offsets[-1] - self._loaded_rows
+        count = min(self.FETCH_BATCH, remaining)
+        if count <= 0:
             return
-            
-        # Konversi kolom tanggal jika perlu
-        for col in [start_col, end_col]:
-            if df[col].dtype != 'datetime64[ns]':
-                df[col] = pd.to_datetime(df[col])
         
-        # Hitung durasi dalam hari
-        df['duration'] = (df[end_col] - df[start_col]).dt.days + 1
-        
-        # Urutkan berdasarkan durasi
-        df = df.sort_values(by='duration', ascending=False)
-        
-        # Ambil top 10 tugas dengan durasi terpanjang
-        plot_df = df.head(10)
-        
-        # Bersihkan plot sebelumnya
-        self.ax.clear()
-        
-        # Plot horizontal bar chart
-        bars = self.ax.barh(plot_df[task_col], plot_df['duration'], color='skyblue')
-        
-        # Tambahkan nilai pada bar
-        for bar in bars:
-            width = bar.get_width()
-            self.ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, 
-                         f"{int(width)} hari", va='center')
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+    
+    def append_frame(self, frame):
+        """Tambahkan chunk baru di akhir data (dipakai saat file masih dibaca)"""
+        old_total = self._offsets[-1]
+        self._add_segment(frame)
+        
+        # Blok terakhir mungkin terformat sebagian, buang agar diformat ulang
+        last_block = old_total // self.BLOCK_ROWS
+        for key in [key for key in self._blocks if key[1] >= last_block]:
+            del self._blocks[key]
+        
+        # Kolom tanggal yang kini punya pecahan detik diformat ulang seluruhnya
+        for col, date_format in list(self._date_formats.items()):
+            if date_format == self.DATE_FORMAT and self._has_fraction(self._segments[-1][col]):
+                self._date_formats[col] = self.DATE_FORMAT_FRACTION
+                for key in [key for key in self._blocks if key[0] == col]:
+                    del self._blocks[key]
+        
+        # Isi layar pertama tanpa menunggu view meminta
+        if self._loaded_rows < self.FETCH_BATCH:
+            self.fetchMore(QModelIndex())
+    
+    def loaded_row_count(self):
+        return self._loaded_rows
+    
+    def _add_segment(self, frame):
+        import numpy as np
         
-        # Tambahkan label dan judul
-        self.ax.set_xlabel('Durasi (hari)')
-        self.ax.set_ylabel('Tugas')
-        self.ax.set_title('10 Tugas dengan Durasi Terpanjang')
+        if len(frame) == 0:
+            return
+        columns = []
+        for i in range(frame.shape[1]):
+            column = frame.iloc[:, i]
+            # Tipe extension (misalnya Int64 dengan NA) disimpan sebagai objek pandas
+            # agar teksnya sama dengan str(nilai), bukan hasil konversi ke float
+            if isinstance(column.dtype, np.dtype):
+                columns.append(column.to_numpy())
+            else:
+                columns.append(column.to_numpy(dtype=object))
+        self._segments.append(columns)
+        self._offsets.append(self._offsets[-1] + len(frame))
+    
+    @staticmethod
+    def _has_fraction(values):
+        """Cek apakah ada nilai datetime64 (selain NaT) yang punya pecahan detik"""
+        import numpy as np
+        
+        if values.dtype.kind != 'M':
+            return False
+        return bool(np.any((values != values.astype('datetime64[s]')) & ~np.isnat(values)))
+    
+    def _date_format(self, col):
+        """Format strftime kolom tanggal, ditentukan sekali dari seluruh kolom"""
+        date_format = self._date_formats.get(col)
+        if date_format is None:
+            fraction = any(self._has_fraction(segment[col]) for segment in self._segments)
+            date_format = self.DATE_FORMAT_FRACTION if fraction else self.DATE_FORMAT
+            self._date_formats[col] = date_format
+        return date_format
+    
+    def _column_slice(self, col, start, stop):
+        """Ambil nilai kolom untuk baris start..stop, melintasi batas segmen jika perlu"""
+        import numpy as np
+        
+        parts = []
+        segment = bisect.bisect_right(self._offsets, start) - 1
+        while start < stop and segment < len(self._segments):
+            seg_start = self._offsets[segment]
+            seg_stop = min(stop, self._offsets[segment + 1])
+            parts.append(self._segments[segment][col][start - seg_start:seg_stop - seg_start])
+            start = seg_stop
+            segment += 1
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+    
+    def _formatted_block(self, col, block):
+        """Ambil teks satu blok baris dari cache, format sekaligus jika belum ada"""
+        import numpy as np
+        import pandas as pd
+        
+        key = (col, block)
+        strings = self._blocks.get(key)
+        if strings is not None:
+            self._blocks.move_to_end(key)
+            return strings
+        
+        start = block * self.BLOCK_ROWS
+        values = self._column_slice(col, start, start + self.BLOCK_ROWS)
+        
+        # Format seluruh blok dengan operasi vektor; kolom tanggal memakai satu format per kolom
+        if values.dtype.kind == 'M':
+            formatted = pd.DatetimeIndex(values).strftime(self._date_format(col)).to_numpy(dtype=object)
+            formatted[np.isnat(values)] = 'NaT'
+            strings = formatted.tolist()
+        else:
+            strings = values.astype(str).tolist()
         
-        # Format grid
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+        self._blocks[key] = strings
+        if len(self._blocks) > self.MAX_CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+        return strings
+
+
+class CsvLoadWorker(QObject):
+    """Worker untuk membaca file CSV secara bertahap di thread terpisah"""
+
+    # Jumlah baris per potongan (chunk) yang dibaca
+    CHUNK_ROWS = 50000
+
+    progress = pyqtSignal(int, int, int)  # byte terbaca, total byte, baris terbaca
+    chunk_loaded = pyqtSignal(object)     # Chunk mentah untuk pratinjau tabel
+    finished = pyqtSignal(object)         # DataFrame hasil parsing
+    failed = pyqtSignal(str)              # Pesan error
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path, cache=None, detector=None, operation=NULL_OPERATION):
+        from gantt_core import ColumnTypeDetector
         
-        self.fig.tight_layout()
-        self.draw()
+        super().__init__()
+        self.file_path = file_path
+        self.cache = cache
+        self.detector = detector if detector is not None else ColumnTypeDetector()
+        self.operation = operation
+        self.file_size = None
+        self.fingerprint = None
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Minta proses pembacaan dihentikan pada chunk berikutnya"""
+        self._cancel_requested = True
+
+    def run(self):
+        """Baca file CSV per chunk dan laporkan progres"""
+        import pandas as pd
+        from gantt_core import convert_date_columns, data_fingerprint
         
-    def plot_timeline_histogram(self, df, start_col, end_col):
-        """Membuat histogram distribusi waktu mulai dan selesai tugas"""
-        if df.empty:
-            return
+        operation = self.operation
+        try:
+            total_bytes = os.path.getsize(self.file_path)
+            self.file_size = total_bytes
+            operation.annotate(file_size=total_bytes)
             
-        # Konversi kolom tanggal jika perlu
-        for col in [start_col, end_col]:
-            if df[col].dtype != 'datetime64[ns]':
-                df[col] = pd.to_datetime(df[col])
-        
-        # Bersihkan plot sebelumnya
-        self.ax.clear()
-        
-        # Plot histogram
-        self.ax.hist([df[start_col], df[end_col]], 
-                     label=['Tanggal Mulai', 'Tanggal Selesai'],
-                     alpha=0.7, bins=10)
-        
-        # Format x-axis sebagai tanggal
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        
-        # Tambahkan label dan judul
-        self.ax.set_xlabel('Tanggal')
-        self.ax.set_ylabel('Jumlah Tugas')
-        self.ax.set_title('Distribusi Tanggal Mulai dan Selesai')
-        self.ax.legend()
-        
-        # Rotasi label tanggal untuk keterbacaan
-        plt.xticks(rotation=45)
-        
-        self.fig.tight_layout()
-        self.draw()
-        
-    def plot_task_overlap(self, df, task_col, start_col, end_col):
-        """Membuat grafik overlap tugas per periode"""
-        if df.empty:
-            return
+            # Gunakan salinan biner jika file belum berubah sejak terakhir dibuka
+            if self.cache is not None:
+                with operation.stage('load'):
+                    df = self.cache.load(self.file_path)
+                if df is not None:
+                    operation.annotate(columns=len(df.columns), cached=True)
+                    self.fingerprint = data_fingerprint(df)
+                    self.progress.emit(total_bytes, total_bytes, len(df))
+                    self.finished.emit(df)
+                    return
             
-        # Konversi kolom tanggal jika perlu
-        for col in [start_col, end_col]:
-            if df[col].dtype != 'datetime64[ns]':
-                df[col] = pd.to_datetime(df[col])
-        
-        # Temukan tanggal awal dan akhir keseluruhan proyek
-        project_start = df[start_col].min()
-        project_end = df[end_col].max()
-        
-        # Buat rentang tanggal untuk analisis
-        date_range = pd.date_range(start=project_start, end=project_end)
-        
-        # Hitung jumlah tugas aktif per hari
-        active_tasks = []
-        for date in date_range:
-            # Hitung berapa tugas yang aktif pada tanggal ini
-            count = sum((df[start_col] <= date) & (df[end_col] >= date))
-            active_tasks.append(count)
-        
-        # Bersihkan plot sebelumnya
-        self.ax.clear()
-        
-        # Plot line chart
-        self.ax.plot(date_range, active_tasks, 'b-', linewidth=2)
-        self.ax.fill_between(date_range, active_tasks, alpha=0.3)
-        
-        # Format x-axis sebagai tanggal
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        
-        # Tandai nilai tertinggi
-        max_overlap = max(active_tasks)
-        max_index = active_tasks.index(max_overlap)
-        max_date = date_range[max_index]
-        
-        self.ax.plot(max_date, max_overlap, 'ro')
-        self.ax.annotate(f'Puncak: {max_overlap} tugas\n{max_date.strftime("%Y-%m-%d")}',
-                         xy=(max_date, max_overlap),
-                         xytext=(max_date + timedelta(days=2), max_overlap + 1),
-                         arrowprops=dict(facecolor='black', shrink=0.05, width=1.5),
-                         fontweight='bold')
-        
-        # Tambahkan label dan judul
-        self.ax.set_xlabel('Tanggal')
-        self.ax.set_ylabel('Jumlah Tugas Aktif')
-        self.ax.set_title('Jumlah Tugas yang Berjalan Bersamaan')
-        
-        # Rotasi label tanggal untuk keterbacaan
-        plt.xticks(rotation=45)
-        
-        # Format grid
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        
-        self.fig.tight_layout()
-        self.draw()
+            chunks = []
+            rows_read = 0
+
+            with open(self.file_path, 'rb') as handle, operation.stage('load'):
+                reader = pd.read_csv(handle, chunksize=self.CHUNK_ROWS)
+                for chunk in reader:
+                    if self._cancel_requested:
+                        reader.close()
+                        self.cancelled.emit()
+                        return
+
+                    chunks.append(chunk)
+                    rows_read += len(chunk)
+                    self.chunk_loaded.emit(chunk)
+                    self.progress.emit(handle.tell(), total_bytes, rows_read)
+
+            if self._cancel_requested:
+                self.cancelled.emit()
+                return
+
+            # Gabungkan semua chunk menjadi satu DataFrame
+            with operation.stage('parse'):
+                if chunks:
+                    df = pd.concat(chunks, ignore_index=True)
+                else:
+                    df = pd.read_csv(self.file_path)
+
+                # Konversi tanggal sekali saja lalu simpan ke cache
+                df = convert_date_columns(df, self.detector)
+            operation.annotate(columns=len(df.columns))
+            if self.cache is not None and not self._cancel_requested:
+                self.cache.store(self.file_path, df)
+            self.fingerprint = data_fingerprint(df)
+
+            self.progress.emit(total_bytes, total_bytes, rows_read)
+            self.finished.emit(df)
+
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class ExportWorker(QObject):
+    """Worker untuk merender file ekspor di thread terpisah dengan figure miliknya sendiri"""
+    
+    progress = pyqtSignal(int, int, str)  # langkah selesai, total langkah, keterangan
+    finished = pyqtSignal(str)            # Path file hasil ekspor
+    failed = pyqtSignal(str)              # Pesan error
+    
+    def __init__(self, render, file_path, operation=NULL_OPERATION):
+        super().__init__()
+        # render(file_path, report_progress) hanya memakai data snapshot, bukan figure di layar
+        self.render = render
+        self.file_path = file_path
+        self.operation = operation
+    
+    def run(self):
+        try:
+            with self.operation.stage('export'):
+                self.render(self.file_path, self.progress.emit)
+            self.finished.emit(self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class WarmupWorker(QObject):
+    """Worker untuk memuat modul berat (pandas, matplotlib) di thread terpisah"""
+    
+    finished = pyqtSignal(str)  # Pesan error, kosong jika berhasil
+    
+    def run(self):
+        try:
+            # gantt_canvas ikut memuat gantt_charts, gantt_core, pandas, dan matplotlib
+            import gantt_canvas  # noqa: F401
+            self.finished.emit("")
+        except Exception as e:
+            self.finished.emit(str(e))
+
+
+class AnalysisTask(QRunnable):
+    """Satu perhitungan analisis yang dijalankan di thread pool"""
+    
+    def __init__(self, request_id, compute, cancel_event, runner):
+        super().__init__()
+        self.request_id = request_id
+        self.compute = compute
+        self.cancel_event = cancel_event
+        self.runner = runner
+    
+    def run(self):
+        # Permintaan yang sudah dibatalkan sebelum sempat jalan dilewati
+        if self.cancel_event.is_set():
+            return
+        try:
+            result = self.compute()
+        except Exception as e:
+            self.runner.failed.emit(self.request_id, str(e))
+            return
+        self.runner.finished.emit(self.request_id, result)
+
+
+class AnalysisRunner(QObject):
+    """Jalankan perhitungan analisis di thread pool, hasil permintaan yang sudah usang dibuang"""
+    
+    finished = pyqtSignal(int, object)  # id permintaan, hasil perhitungan
+    failed = pyqtSignal(int, str)       # id permintaan, pesan error
+    busy_changed = pyqtSignal(bool)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self._next_id = 0
+        self._jobs = {}     # id permintaan -> (slot, event batal, callback hasil, callback error)
+        self._current = {}  # slot -> id permintaan terbaru
+        self.finished.connect(self._on_finished)
+        self.failed.connect(self._on_failed)
+    
+    def submit(self, slot, compute, on_result, on_error):
+        """Jalankan compute() di background; permintaan lama pada slot yang sama dibatalkan"""
+        self._drop(slot)
+        self._next_id += 1
+        request_id = self._next_id
+        cancel_event = threading.Event()
+        self._jobs[request_id] = (slot, cancel_event, on_result, on_error)
+        self._current[slot] = request_id
+        self.pool.start(AnalysisTask(request_id, compute, cancel_event, self))
+        self.busy_changed.emit(True)
+        return request_id
+    
+    def cancel(self, slot=None):
+        """Batalkan permintaan pada slot tertentu, atau semua jika slot None"""
+        for name in ([slot] if slot is not None else list(self._current)):
+            self._drop(name)
+        self.busy_changed.emit(self.is_busy())
+    
+    def is_busy(self):
+        return bool(self._current)
+    
+    def shutdown(self):
+        """Batalkan semua permintaan dan tunggu thread pool selesai"""
+        self.cancel()
+        self.pool.clear()
+        self.pool.waitForDone()
+    
+    def _drop(self, slot):
+        # Perhitungan yang sedang berjalan tidak bisa dihentikan, hasilnya cukup diabaikan
+        request_id = self._current.pop(slot, None)
+        if request_id is not None:
+            self._jobs.pop(request_id)[1].set()
+    
+    def _take(self, request_id):
+        job = self._jobs.pop(request_id, None)
+        if job is not None:
+            del self._current[job[0]]
+            self.busy_changed.emit(self.is_busy())
+        return job
+    
+    def _on_finished(self, request_id, result):
+        job = self._take(request_id)
+        if job is not None:
+            job[2](result)
+    
+    def _on_failed(self, request_id, message):
+        job = self._take(request_id)
+        if job is not None:
+            job[3](message)
+
+
+class PerformanceDialog(QDialog):
+    """Jendela Performa: waktu tiap tahap, jumlah baris, dan memori puncak operasi terbaru"""
+    
+    COLUMNS = (["Waktu", "Operasi", "Keterangan", "Status", "Baris"]
+               + [f"{stage} (ms)" for stage in STAGES]
+               + ["Total (ms)", "Memori puncak (MB)"])
+    
+    def __init__(self, tracer, parent=None):
+        super().__init__(parent)
+        self.tracer = tracer
+        self.setWindowTitle("Performa")
+        self.resize(1100, 400)
+        
+        layout = QVBoxLayout(self)
+        self.enabled_check = QCheckBox("Catat waktu operasi")
+        self.enabled_check.setChecked(tracer.enabled)
+        self.enabled_check.toggled.connect(self.set_enabled)
+        layout.addWidget(self.enabled_check)
+        
+        # Log JSON Lines untuk diagnosis di lokasi pengguna (lihat gantt_perf_report.py)
+        self.log_check = QCheckBox("Simpan ke file log")
+        self.log_check.setChecked(tracer.log is not None)
+        self.log_check.setToolTip((tracer.log or PerfLog()).path)
+        self.log_check.toggled.connect(self.set_logging)
+        layout.addWidget(self.log_check)
+        
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+        
+        button_layout = QHBoxLayout()
+        clear_button = QPushButton("Bersihkan")
+        clear_button.clicked.connect(self.clear)
+        close_button = QPushButton("Tutup")
+        close_button.clicked.connect(self.close)
+        button_layout.addStretch()
+        button_layout.addWidget(clear_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        
+        tracer.listeners.append(self.on_record)
+    
+    def set_enabled(self, enabled):
+        self.tracer.enabled = enabled
+    
+    def set_logging(self, enabled):
+        """Mulai/berhenti menulis log; log hanya berisi operasi yang dicatat tracer"""
+        self.tracer.log = PerfLog() if enabled else None
+        if enabled:
+            self.enabled_check.setChecked(True)
+    
+    def clear(self):
+        self.tracer.clear()
+        self.refresh()
+    
+    def on_record(self, record):
+        if self.isVisible():
+            self.refresh()
+    
+    def showEvent(self, event):
+        self.refresh()
+        super().showEvent(event)
+    
+    def refresh(self):
+        """Isi tabel dari riwayat tracer, operasi terbaru di atas"""
+        records = list(reversed(self.tracer.records))
+        self.table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            detail = record['detail']
+            if record.get('cached'):
+                detail = f"{detail} (cache)".strip()
+            values = [datetime.fromtimestamp(record['timestamp']).strftime('%H:%M:%S'),
+                      record['operation'], detail, record['status'],
+                      '-' if record['rows'] is None else f"{record['rows']:,}"]
+            values += [self.format_ms(record['stages'].get(stage)) for stage in STAGES]
+            values.append(self.format_ms(record['total']))
+            values.append(self.format_memory(record['peak_memory'], record['memory_growth']))
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column >= 4:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        self.table.resizeColumnsToContents()
+    
+    @staticmethod
+    def format_ms(seconds):
+        return '-' if seconds is None else f"{seconds * 1000:,.1f}"
+    
+    @staticmethod
+    def format_memory(peak, growth):
+        """Memori puncak proses, beserta kenaikannya selama operasi jika ada"""
+        if peak is None:
+            return '-'
+        text = f"{peak / 1048576:,.1f}"
+        if growth:
+            text += f" (+{growth / 1048576:,.1f})"
+        return text
 
 
 class MainWindow(QMainWindow):
@@ -270,12 +525,49 @@ class MainWindow(QMainWindow):
         
         # Properti data
         self.df = None
+        self.df_file_size = None
+        
+        # Properti untuk pemuatan CSV di background
+        self.load_thread = None
+        self.load_worker = None
+        self.loading_file_path = None
+        self.preview_model = None
+        self.previous_model = None
+        
+        # TaskTable per pilihan kolom, dibuang setiap kali data baru dimuat
+        self.task_tables = {}
+        
+        # Hasil analisis disimpan berdasarkan sidik jari data dan parameternya
+        self.df_fingerprint = None
+        
+        # Cache dan detektor dibuat saat file pertama dimuat (butuh pandas), lihat init_data_engine
+        self.csv_cache = None
+        self.column_types = None
+        self.analysis_cache = None
+        
+        # Modul berat dimuat di background setelah jendela tampil, lihat start_warmup
+        self.warmup_thread = None
+        self.warmup_worker = None
+        
+        # Perhitungan analisis dijalankan di thread pool, GUI hanya menggambar hasilnya
+        self.analysis_runner = AnalysisRunner(self)
+        
+        # Properti untuk ekspor di background
+        self.export_thread = None
+        self.export_worker = None
+        self.export_labels = None
+        self.export_operation = None
+        
+        # Waktu tiap tahap operasi, dicatat hanya jika diaktifkan (lihat show_performance)
+        self.perf = PerfTracer()
+        self.perf_dialog = None
         
         # Setup UI
         self.setWindowTitle("Aplikasi Integrasi Gantt Chart dan Analisis Data")
         self.setGeometry(100, 100, 1200, 600)
         self.setup_ui()
         self.setup_themes()
+        self.analysis_runner.busy_changed.connect(self.on_analysis_busy_changed)
         
     def setup_ui(self):
         # Buat menu
@@ -367,12 +659,10 @@ class MainWindow(QMainWindow):
         canvas_widget = QWidget()
         canvas_layout = QVBoxLayout(canvas_widget)
 
-        # Canvas untuk Gantt Chart
-        self.gantt_canvas = GanttChartCanvas()
-        gantt_toolbar = NavigationToolbar(self.gantt_canvas, self)
-
-        canvas_layout.addWidget(gantt_toolbar)
-        canvas_layout.addWidget(self.gantt_canvas)
+        # Canvas untuk Gantt Chart dibuat setelah matplotlib dimuat, lihat ensure_canvases
+        self.gantt_placeholder = QLabel("Memuat komponen grafik...")
+        self.gantt_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        canvas_layout.addWidget(self.gantt_placeholder, 1)
 
         # UBAH: Susun secara horizontal
         gantt_layout.addWidget(config_widget)      # Form di kiri
@@ -398,23 +688,131 @@ class MainWindow(QMainWindow):
         
         analysis_form.addRow("Jenis Analisis:", self.analysis_type_combo)
         
+        # Jumlah tugas terpanjang untuk analisis durasi
+        self.top_n_spin = QSpinBox()
+        self.top_n_spin.setRange(1, 100000)
+        self.top_n_spin.setValue(10)
+        analysis_form.addRow("Tampilkan N:", self.top_n_spin)
+        
         update_analysis_button = QPushButton("Jalankan Analisis")
         update_analysis_button.clicked.connect(self.update_analysis)
         analysis_form.addRow(update_analysis_button)
         
         analysis_layout.addWidget(analysis_config)
         
-        # Canvas untuk analisis
-        self.analysis_canvas = AnalysisCanvas()
-        analysis_toolbar = NavigationToolbar(self.analysis_canvas, self)
-        
-        analysis_layout.addWidget(analysis_toolbar)
-        analysis_layout.addWidget(self.analysis_canvas)
+        # Canvas untuk analisis, dibuat bersama canvas Gantt
+        self.analysis_placeholder = QLabel("Memuat komponen grafik...")
+        self.analysis_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        analysis_layout.addWidget(self.analysis_placeholder, 1)
         
         self.tab_widget.addTab(analysis_tab, "Analisis Data")
         
         main_layout.addWidget(self.tab_widget)
+        
+        # Progress bar dan tombol batal untuk pemuatan file di status bar
+        self.load_progress_bar = QProgressBar()
+        self.load_progress_bar.setMaximumWidth(250)
+        self.load_progress_bar.setRange(0, 100)
+        self.load_progress_bar.setVisible(False)
+        
+        self.cancel_load_button = QPushButton("Batal")
+        self.cancel_load_button.setVisible(False)
+        self.cancel_load_button.clicked.connect(self.cancel_load)
+        
+        self.statusBar().addPermanentWidget(self.load_progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_load_button)
+        
+        # Indikator sibuk dan tombol batal untuk perhitungan analisis
+        self.analysis_busy_bar = QProgressBar()
+        self.analysis_busy_bar.setMaximumWidth(150)
+        self.analysis_busy_bar.setRange(0, 0)
+        self.analysis_busy_bar.setVisible(False)
+        
+        self.cancel_analysis_button = QPushButton("Batal Analisis")
+        self.cancel_analysis_button.setVisible(False)
+        self.cancel_analysis_button.clicked.connect(self.cancel_analysis)
+        
+        self.statusBar().addPermanentWidget(self.analysis_busy_bar)
+        self.statusBar().addPermanentWidget(self.cancel_analysis_button)
+        
+        # Progress bar untuk ekspor file
+        self.export_progress_bar = QProgressBar()
+        self.export_progress_bar.setMaximumWidth(150)
+        self.export_progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.export_progress_bar)
+        
+        # Hasil yang sedang dihitung tidak relevan lagi jika pilihan berubah
+        for combo in (self.task_col_combo, self.start_col_combo, self.end_col_combo):
+            combo.currentTextChanged.connect(lambda _: self.analysis_runner.cancel())
+        self.progress_col_combo.currentTextChanged.connect(
+            lambda _: self.analysis_runner.cancel('gantt'))
+        self.analysis_type_combo.currentTextChanged.connect(
+            lambda _: self.analysis_runner.cancel('analysis'))
+        self.top_n_spin.valueChanged.connect(lambda _: self.analysis_runner.cancel('analysis'))
 
+    def ensure_canvases(self):
+        """Buat canvas matplotlib dan toolbar-nya saat pertama kali dibutuhkan"""
+        if hasattr(self, 'gantt_canvas'):
+            return
+        from gantt_canvas import GanttChartCanvas, AnalysisCanvas, NavigationToolbar
+        
+        self.gantt_canvas = GanttChartCanvas()
+        self.analysis_canvas = AnalysisCanvas()
+        
+        # Ganti placeholder dengan toolbar dan canvas di posisi yang sama
+        for placeholder, canvas in ((self.gantt_placeholder, self.gantt_canvas),
+                                    (self.analysis_placeholder, self.analysis_canvas)):
+            layout = placeholder.parentWidget().layout()
+            layout.insertWidget(layout.indexOf(placeholder), NavigationToolbar(canvas, self))
+            layout.replaceWidget(placeholder, canvas)
+            placeholder.deleteLater()
+        self.gantt_placeholder = None
+        self.analysis_placeholder = None
+        
+        # Palet tema dikompilasi sekali, lalu dipakai setiap kali tema diganti
+        from gantt_theme import ThemeEngine
+        self.theme_engine = ThemeEngine()
+        self.stale_canvases = set()
+        self.tab_widget.currentChanged.connect(self.draw_stale_canvases)
+        self.apply_chart_theme()
+    
+    def init_data_engine(self):
+        """Buat cache CSV, detektor kolom, dan cache analisis (memuat pandas)"""
+        if self.csv_cache is not None:
+            return
+        from gantt_core import ColumnTypeDetector, CsvCache, AnalysisCache
+        
+        self.csv_cache = CsvCache()
+        self.column_types = ColumnTypeDetector()
+        self.analysis_cache = AnalysisCache()
+    
+    def start_warmup(self):
+        """Muat pandas dan matplotlib di thread background setelah jendela tampil"""
+        self.statusBar().showMessage("Memuat komponen...")
+        self.warmup_thread = QThread(self)
+        self.warmup_worker = WarmupWorker()
+        self.warmup_worker.moveToThread(self.warmup_thread)
+        self.warmup_thread.started.connect(self.warmup_worker.run)
+        self.warmup_worker.finished.connect(self.on_warmup_finished)
+        self.warmup_thread.start()
+    
+    def on_warmup_finished(self, message):
+        """Modul sudah dimuat, buat canvas agar grafik pertama tidak menunggu"""
+        self.warmup_thread.quit()
+        self.warmup_thread.wait()
+        self.warmup_worker.deleteLater()
+        self.warmup_thread.deleteLater()
+        self.warmup_thread = None
+        self.warmup_worker = None
+        
+        if message:
+            # Kegagalan import akan muncul lagi (dengan pesan lengkap) saat modul dipakai
+            self.statusBar().showMessage(f"Gagal memuat komponen: {message}", 5000)
+            return
+        self.ensure_canvases()
+        if self.statusBar().currentMessage() == "Memuat komponen...":
+            self.statusBar().showMessage("Siap", 3000)
+    
     def create_menus(self):
         # Menu bar
         menu_bar = self.menuBar()
@@ -430,9 +828,15 @@ class MainWindow(QMainWindow):
         export_gantt_action = QAction("Ekspor Gantt Chart", self)
         export_gantt_action.triggered.connect(self.export_gantt)
         
+        export_gantt_pages_action = QAction("Ekspor Gantt Chart (PDF Multi-halaman)", self)
+        export_gantt_pages_action.triggered.connect(self.export_gantt_pages)
+        
         export_analysis_action = QAction("Ekspor Analisis", self)
         export_analysis_action.triggered.connect(self.export_analysis)
         
+        export_report_action = QAction("Ekspor Laporan PDF", self)
+        export_report_action.triggered.connect(self.export_report)
+        
         exit_action = QAction("Keluar", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
@@ -440,7 +844,9 @@ class MainWindow(QMainWindow):
         # Tambahkan aksi ke menu
         file_menu.addAction(open_action)
         file_menu.addAction(export_gantt_action)
+        file_menu.addAction(export_gantt_pages_action)
         file_menu.addAction(export_analysis_action)
+        file_menu.addAction(export_report_action)
         file_menu.addSeparator()
         file_menu.addAction(exit_action)
         
@@ -461,31 +867,180 @@ class MainWindow(QMainWindow):
         theme_action.triggered.connect(self.toggle_theme)
 
         view_menu.addAction(theme_action)
+
+        performance_action = QAction("Performa", self)
+        performance_action.triggered.connect(self.show_performance)
+
+        view_menu.addAction(performance_action)
     
     def load_csv(self):
         """Memuat dan memproses file CSV"""
+        if self.load_thread is not None:
+            QMessageBox.warning(self, "Peringatan", "File lain sedang dimuat")
+            return
+        
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getOpenFileName(self, "Pilih File CSV", "", "CSV Files (*.csv)")
         
         if file_path:
-            try:
-                # Baca file CSV
-                self.df = pd.read_csv(file_path)
-                
-                # Tampilkan data di tabel
-                model = PandasModel(self.df)
-                self.table_view.setModel(model)
-                
-                # Perbarui combo box dengan nama kolom
-                self.update_column_combos()
-                
-                # Beralih ke tab data
-                self.tab_widget.setCurrentIndex(0)
-                
-                QMessageBox.information(self, "Berhasil", f"File CSV berhasil dimuat: {file_path}")
+            self.start_csv_load(file_path)
+    
+    def start_csv_load(self, file_path):
+        """Mulai membaca file CSV di thread background"""
+        self.init_data_engine()
+        self.loading_file_path = file_path
+        
+        # Simpan model lama untuk dikembalikan jika pemuatan gagal/dibatalkan
+        self.previous_model = self.table_view.model()
+        self.preview_model = None
+        
+        self.load_thread = QThread(self)
+        operation = self.perf.begin("Muat CSV", os.path.basename(file_path))
+        self.load_worker = CsvLoadWorker(file_path, self.csv_cache, operation=operation)
+        self.load_worker.moveToThread(self.load_thread)
+        
+        # Hubungkan sinyal worker
+        self.load_thread.started.connect(self.load_worker.run)
+        self.load_worker.progress.connect(self.on_load_progress)
+        self.load_worker.chunk_loaded.connect(self.on_chunk_loaded)
+        self.load_worker.finished.connect(self.on_load_finished)
+        self.load_worker.failed.connect(self.on_load_failed)
+        self.load_worker.cancelled.connect(self.on_load_cancelled)
+        
+        # Tampilkan progress bar
+        self.load_progress_bar.setValue(0)
+        self.load_progress_bar.setVisible(True)
+        self.cancel_load_button.setVisible(True)
+        self.cancel_load_button.setEnabled(True)
+        self.statusBar().showMessage(f"Memuat {os.path.basename(file_path)}...")
+        
+        self.load_thread.start()
+    
+    def cancel_load(self):
+        """Batalkan pemuatan file CSV yang sedang berjalan"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.cancel_load_button.setEnabled(False)
+            self.statusBar().showMessage("Membatalkan pemuatan...")
+    
+    def on_load_progress(self, bytes_read, total_bytes, rows_read):
+        """Perbarui progress bar selama file dibaca"""
+        if total_bytes > 0:
+            self.load_progress_bar.setValue(int(bytes_read * 100 / total_bytes))
+        self.statusBar().showMessage(
+            f"Memuat {os.path.basename(self.loading_file_path)}: "
+            f"{bytes_read / 1048576:.1f} / {total_bytes / 1048576:.1f} MB, {rows_read:,} baris")
+    
+    def on_chunk_loaded(self, chunk):
+        """Tampilkan baris yang sudah terbaca selagi sisa file dimuat"""
+        if self.preview_model is None:
+            self.preview_model = PandasModel(chunk)
+            self.table_view.setModel(self.preview_model)
+            self.tab_widget.setCurrentIndex(0)
+        else:
+            self.preview_model.append_frame(chunk)
+    
+    def on_load_finished(self, df):
+        """Pasang DataFrame hasil parsing setelah pemuatan selesai"""
+        file_path = self.loading_file_path
+        detector = self.load_worker.detector
+        fingerprint = self.load_worker.fingerprint
+        file_size = self.load_worker.file_size
+        operation = self.load_worker.operation
+        self.finish_csv_load()
+        
+        try:
+            # Perhitungan untuk data lama tidak dipakai lagi
+            self.analysis_runner.cancel()
             
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Gagal memuat file CSV: {str(e)}")
+            self.df = df
+            self.df_file_size = file_size
+            self.task_tables = {}
+            
+            # Format tanggal yang terdeteksi saat memuat dipakai ulang nanti
+            self.column_types = detector
+            self.df_fingerprint = fingerprint
+            
+            # Tampilkan data di tabel, pertahankan baris yang sudah terlihat di pratinjau
+            initial_rows = None
+            scroll_value = 0
+            if self.preview_model is not None:
+                initial_rows = self.preview_model.loaded_row_count()
+                scroll_value = self.table_view.verticalScrollBar().value()
+            model = PandasModel(self.df, initial_rows)
+            self.table_view.setModel(model)
+            self.table_view.verticalScrollBar().setValue(scroll_value)
+            self.preview_model = None
+            self.previous_model = None
+            
+            # Perbarui combo box dengan nama kolom
+            self.update_column_combos()
+            
+            # Beralih ke tab data
+            self.tab_widget.setCurrentIndex(0)
+            operation.finish(rows=len(df))
+            
+            self.statusBar().showMessage(f"{len(df):,} baris dimuat", 5000)
+            QMessageBox.information(self, "Berhasil", f"File CSV berhasil dimuat: {file_path}")
+        
+        except Exception as e:
+            operation.finish(status='gagal')
+            QMessageBox.critical(self, "Error", f"Gagal memuat file CSV: {str(e)}")
+    
+    def on_load_failed(self, message):
+        """Tampilkan error jika pemuatan gagal"""
+        self.load_worker.operation.finish(status='gagal')
+        self.finish_csv_load()
+        self.restore_previous_model()
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", f"Gagal memuat file CSV: {message}")
+    
+    def on_load_cancelled(self):
+        """Bersihkan status setelah pemuatan dibatalkan"""
+        self.load_worker.operation.finish(status='dibatalkan')
+        self.finish_csv_load()
+        self.restore_previous_model()
+        self.statusBar().showMessage("Pemuatan file dibatalkan", 5000)
+    
+    def restore_previous_model(self):
+        """Kembalikan tabel ke data sebelumnya jika pratinjau sudah ditampilkan"""
+        if self.preview_model is not None:
+            self.table_view.setModel(self.previous_model)
+        self.preview_model = None
+        self.previous_model = None
+    
+    def finish_csv_load(self):
+        """Hentikan thread pemuatan dan sembunyikan progress bar"""
+        if self.load_thread is not None:
+            self.load_thread.quit()
+            self.load_thread.wait()
+            self.load_worker.deleteLater()
+            self.load_thread.deleteLater()
+        
+        self.load_thread = None
+        self.load_worker = None
+        self.loading_file_path = None
+        self.load_progress_bar.setVisible(False)
+        self.cancel_load_button.setVisible(False)
+    
+    def closeEvent(self, event):
+        """Pastikan thread pemuatan dan analisis berhenti sebelum jendela ditutup"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.load_thread.quit()
+            self.load_thread.wait()
+        self.analysis_runner.shutdown()
+        
+        # Import modul tidak bisa dihentikan, tunggu sampai selesai
+        if self.warmup_thread is not None:
+            self.warmup_thread.quit()
+            self.warmup_thread.wait()
+        
+        # Ekspor yang sedang ditulis dibiarkan selesai agar file tidak rusak
+        if self.export_thread is not None:
+            self.export_thread.quit()
+            self.export_thread.wait()
+        super().closeEvent(event)
     
     def update_column_combos(self):
         """Memperbarui combo box dengan nama kolom dari DataFrame"""
@@ -532,61 +1087,92 @@ class MainWindow(QMainWindow):
         """Menebak kolom yang mungkin untuk Gantt Chart berdasarkan nama atau tipe data"""
         if self.df is None:
             return
-            
-        # Kata kunci untuk menebak kolom
-        task_keywords = ['task', 'tugas', 'aktivitas', 'kegiatan', 'nama']
-        start_keywords = ['start', 'mulai', 'begin', 'awal']
-        end_keywords = ['end', 'finish', 'selesai', 'akhir']
-        progress_keywords = ['progress', 'kemajuan', 'persen', 'percent', '%']
-        
-        # Fungsi untuk menemukan kolom berdasarkan kata kunci
-        def find_column_by_keywords(keywords):
-            for col in self.df.columns:
-                col_lower = col.lower()
-                if any(keyword in col_lower for keyword in keywords):
-                    return col
-            return None
-        
-        # Tebak kolom tugas
-        task_col = find_column_by_keywords(task_keywords)
-        if task_col:
-            index = self.task_col_combo.findText(task_col)
-            if index >= 0:
-                self.task_col_combo.setCurrentIndex(index)
-        
-        # Tebak kolom tanggal mulai dan selesai
-        # Prioritaskan kolom dengan tipe data datetime
-        date_columns = []
-        for col in self.df.columns:
-            try:
-                # Coba konversi ke datetime
-                pd.to_datetime(self.df[col])
-                date_columns.append(col)
-            except:
-                pass
-        
-        if len(date_columns) >= 2:
-            # Jika ada minimal 2 kolom tanggal
-            start_col = find_column_by_keywords(start_keywords) or date_columns[0]
-            end_col = find_column_by_keywords(end_keywords) or date_columns[1]
-            
-            # Atur combo box
-            if start_col:
-                index = self.start_col_combo.findText(start_col)
-                if index >= 0:
-                    self.start_col_combo.setCurrentIndex(index)
-            
-            if end_col:
-                index = self.end_col_combo.findText(end_col)
+        
+        from gantt_core import guess_task_columns
+        
+        guessed = guess_task_columns(self.df, self.column_types)
+        for combo, col in [
+            (self.task_col_combo, guessed['task']),
+            (self.start_col_combo, guessed['start']),
+            (self.end_col_combo, guessed['end']),
+            (self.progress_col_combo, guessed['progress'])
+        ]:
+            if col:
+                index = combo.findText(col)
                 if index >= 0:
-                    self.end_col_combo.setCurrentIndex(index)
+                    combo.setCurrentIndex(index)
+    
+    def task_table_loader(self, task_col, start_col, end_col, progress_col=None):
+        """Buat fungsi pengambil TaskTable yang aman dipanggil dari thread analisis"""
+        # Data dan cache tabel diikat sekarang, sehingga pemuatan file baru tidak tercampur
+        from gantt_core import TaskTable
+        
+        df, detector, tables = self.df, self.column_types, self.task_tables
+        key = (task_col, start_col, end_col, progress_col)
+        
+        def load():
+            table = tables.get(key)
+            if table is None:
+                table = TaskTable(df, task_col, start_col, end_col, progress_col, detector)
+                tables[key] = table
+            return table
+        return load
+    
+    def report_skipped_rows(self, columns):
+        """Tampilkan jumlah baris yang tidak digambar karena tanggalnya kosong atau tidak valid"""
+        if columns is None:
+            return
+        key = tuple(columns) + (None,) * (4 - len(columns))
+        table = self.task_tables.get(key)
+        if table is not None and table.skipped_rows:
+            self.statusBar().showMessage(
+                f"{table.skipped_rows:,} baris dilewati karena tanggal kosong atau tidak valid", 10000)
+    
+    def begin_operation(self, name, detail=''):
+        """Mulai pencatatan operasi pada data yang sedang dimuat (ukuran file dan jumlah kolom)"""
+        operation = self.perf.begin(name, detail)
+        if self.df is not None:
+            operation.annotate(file_size=self.df_file_size, columns=len(self.df.columns))
+        return operation
+    
+    def traced_compute(self, operation, load_table, compute):
+        """Bungkus compute(table) agar waktu pembuatan TaskTable dan perhitungannya tercatat"""
+        def run():
+            with operation.stage('parse'):
+                table = load_table()
+            with operation.stage('compute'):
+                return compute(table)
+        return run
+    
+    def request_result(self, slot, name, params, compute, on_result, on_error,
+                       operation=NULL_OPERATION):
+        """Ambil hasil dari cache, atau hitung di thread pool lalu simpan ke cache"""
+        key = (self.df_fingerprint, name) + tuple(params)
+        found, result = self.analysis_cache.lookup(key)
+        if found:
+            operation.annotate(cached=True)
+            self.analysis_runner.cancel(slot)
+            on_result(result)
+            return
         
-        # Tebak kolom progress
-        progress_col = find_column_by_keywords(progress_keywords)
-        if progress_col:
-            index = self.progress_col_combo.findText(progress_col)
-            if index >= 0:
-                self.progress_col_combo.setCurrentIndex(index)
+        def store_and_show(result):
+            self.analysis_cache.store(key, result)
+            on_result(result)
+        self.analysis_runner.submit(slot, compute, store_and_show, on_error)
+    
+    def cancel_analysis(self):
+        """Batalkan perhitungan analisis yang sedang berjalan"""
+        self.analysis_runner.cancel()
+        self.statusBar().showMessage("Analisis dibatalkan", 5000)
+    
+    def on_analysis_busy_changed(self, busy):
+        """Tampilkan indikator sibuk selama analisis dihitung di background"""
+        self.analysis_busy_bar.setVisible(busy)
+        self.cancel_analysis_button.setVisible(busy)
+        if busy:
+            self.statusBar().showMessage("Menghitung analisis...")
+        elif self.statusBar().currentMessage() == "Menghitung analisis...":
+            self.statusBar().clearMessage()
     
     def update_gantt_chart(self):
         """Perbarui tampilan Gantt Chart berdasarkan konfigurasi"""
@@ -605,15 +1191,35 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Peringatan", "Pilih kolom untuk tugas, tanggal mulai, dan tanggal selesai")
             return
         
+        from gantt_core import prepare_gantt
+        self.ensure_canvases()
+        
+        # Siapkan geometri Gantt di background, gambar setelah selesai
+        columns = (task_col, start_col, end_col, progress_col)
+        load_table = self.task_table_loader(*columns)
+        operation = self.begin_operation("Gantt Chart")
+        self.request_result('gantt', 'gantt', columns,
+                            self.traced_compute(operation, load_table, prepare_gantt),
+                            lambda prepared: self.show_gantt_chart(prepared, operation, columns),
+                            lambda message: self.on_gantt_failed(message, operation),
+                            operation)
+    
+    def show_gantt_chart(self, prepared, operation=NULL_OPERATION, columns=None):
+        """Gambar Gantt Chart dari hasil perhitungan (di thread GUI)"""
         try:
-            # Plot Gantt Chart
-            self.gantt_canvas.plot_gantt(self.df, task_col, start_col, end_col, progress_col)
+            self.gantt_canvas.plot_gantt(prepared, operation)
+            self.report_skipped_rows(columns)
             
             # Beralih ke tab Gantt
             self.tab_widget.setCurrentIndex(1)
+            operation.finish(rows=len(self.df))
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal membuat Gantt Chart: {str(e)}")
+            self.on_gantt_failed(str(e), operation)
+    
+    def on_gantt_failed(self, message, operation=NULL_OPERATION):
+        operation.finish(status='gagal')
+        QMessageBox.critical(self, "Error", f"Gagal membuat Gantt Chart: {message}")
     
     def update_analysis(self):
         """Perbarui tampilan analisis berdasarkan jenis yang dipilih"""
@@ -632,52 +1238,222 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Peringatan", "Pilih kolom untuk tugas, tanggal mulai, dan tanggal selesai")
             return
         
+        from gantt_core import compute_task_duration, compute_timeline_histogram, compute_task_overlap
+        self.ensure_canvases()
+        
+        columns = (task_col, start_col, end_col)
+        load_table = self.task_table_loader(*columns)
+        
+        # Pilih perhitungan dan fungsi gambar untuk jenis analisis
+        if analysis_type == "Durasi Tugas":
+            top_n = self.top_n_spin.value()
+            name, params = 'duration', columns + (top_n,)
+            compute = lambda table: compute_task_duration(table, top_n)
+            draw = self.analysis_canvas.plot_task_duration
+        elif analysis_type == "Distribusi Timeline":
+            name, params = 'timeline', columns
+            compute = compute_timeline_histogram
+            draw = self.analysis_canvas.plot_timeline_histogram
+        elif analysis_type == "Overlap Tugas":
+            name, params = 'overlap', columns
+            compute = compute_task_overlap
+            draw = self.analysis_canvas.plot_task_overlap
+        else:
+            return
+        
+        # Hitung di background (atau ambil dari cache), gambar setelah selesai
+        operation = self.begin_operation("Analisis", analysis_type)
+        self.request_result('analysis', name, params,
+                            self.traced_compute(operation, load_table, compute),
+                            lambda result: self.show_analysis(draw, result, operation, columns),
+                            lambda message: self.on_analysis_failed(message, operation),
+                            operation)
+    
+    def show_analysis(self, draw, result, operation=NULL_OPERATION, columns=None):
+        """Gambar hasil analisis (di thread GUI)"""
         try:
-            # Jalankan analisis yang dipilih
-            if analysis_type == "Durasi Tugas":
-                self.analysis_canvas.plot_task_duration(self.df, task_col, start_col, end_col)
-            elif analysis_type == "Distribusi Timeline":
-                self.analysis_canvas.plot_timeline_histogram(self.df, start_col, end_col)
-            elif analysis_type == "Overlap Tugas":
-                self.analysis_canvas.plot_task_overlap(self.df, task_col, start_col, end_col)
+            draw(result, operation)
+            self.report_skipped_rows(columns)
             
             # Beralih ke tab Analisis
             self.tab_widget.setCurrentIndex(2)
+            operation.finish(rows=len(self.df))
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal melakukan analisis: {str(e)}")
+            self.on_analysis_failed(str(e), operation)
+    
+    def on_analysis_failed(self, message, operation=NULL_OPERATION):
+        operation.finish(status='gagal')
+        QMessageBox.critical(self, "Error", f"Gagal melakukan analisis: {message}")
     
     def export_gantt(self):
         """Ekspor Gantt Chart sebagai gambar"""
         if self.df is None or self.tab_widget.currentIndex() != 1:
             QMessageBox.warning(self, "Peringatan", "Tidak ada Gantt Chart yang ditampilkan")
             return
+        self.ensure_canvases()
         
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getSaveFileName(self, "Simpan Gantt Chart", "", "PNG Files (*.png);;PDF Files (*.pdf)")
         
         if file_path:
-            try:
-                self.gantt_canvas.fig.savefig(file_path, bbox_inches='tight', dpi=300)
-                QMessageBox.information(self, "Berhasil", f"Gantt Chart disimpan ke: {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Gagal menyimpan Gantt Chart: {str(e)}")
+            self.start_export(self.gantt_canvas.snapshot(), file_path, "Gantt Chart")
+    
+    def export_gantt_pages(self):
+        """Ekspor Gantt Chart besar sebagai PDF multi-halaman (per pita baris dan jendela waktu)"""
+        self.ensure_canvases()
+        snapshot = self.gantt_canvas.snapshot()
+        if self.df is None or snapshot is None:
+            QMessageBox.warning(self, "Peringatan", "Tidak ada Gantt Chart yang ditampilkan")
+            return
+        
+        rows_per_page, ok = QInputDialog.getInt(self, "PDF Multi-halaman", "Tugas per halaman:",
+                                                25, 5, 200)
+        if not ok:
+            return
+        time_windows, ok = QInputDialog.getInt(self, "PDF Multi-halaman",
+                                               "Jendela waktu per pita baris:", 1, 1, 20)
+        if not ok:
+            return
+        
+        file_dialog = QFileDialog()
+        file_path, _ = file_dialog.getSaveFileName(self, "Simpan Gantt Chart", "", "PDF Files (*.pdf)")
+        if not file_path:
+            return
+        if self.export_thread is not None:
+            QMessageBox.warning(self, "Peringatan", "Ekspor lain sedang berjalan")
+            return
+        
+        _, prepared, view = snapshot
+        
+        def render(path, report_progress):
+            from gantt_charts import export_gantt_pages
+            export_gantt_pages(prepared, path, rows_per_page, time_windows, view, report_progress)
+        
+        self.run_export(render, file_path, "Gantt Chart", "Gantt Chart")
     
     def export_analysis(self):
         """Ekspor hasil analisis sebagai gambar"""
         if self.df is None or self.tab_widget.currentIndex() != 2:
             QMessageBox.warning(self, "Peringatan", "Tidak ada analisis yang ditampilkan")
             return
+        self.ensure_canvases()
         
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getSaveFileName(self, "Simpan Hasil Analisis", "", "PNG Files (*.png);;PDF Files (*.pdf)")
         
         if file_path:
-            try:
-                self.analysis_canvas.fig.savefig(file_path, bbox_inches='tight', dpi=300)
-                QMessageBox.information(self, "Berhasil", f"Hasil analisis disimpan ke: {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Gagal menyimpan hasil analisis: {str(e)}")
+            self.start_export(self.analysis_canvas.snapshot(), file_path, "Hasil analisis", "hasil analisis")
+    
+    def export_report(self):
+        """Ekspor Gantt Chart dan ketiga analisis sebagai satu laporan PDF"""
+        if self.df is None:
+            QMessageBox.warning(self, "Peringatan", "Tidak ada data yang dimuat")
+            return
+        
+        task_col = self.task_col_combo.currentText()
+        start_col = self.start_col_combo.currentText()
+        end_col = self.end_col_combo.currentText()
+        progress_col = self.progress_col_combo.currentText() if self.progress_col_combo.currentText() else None
+        if not task_col or not start_col or not end_col:
+            QMessageBox.warning(self, "Peringatan", "Pilih kolom untuk tugas, tanggal mulai, dan tanggal selesai")
+            return
+        
+        file_dialog = QFileDialog()
+        file_path, _ = file_dialog.getSaveFileName(self, "Simpan Laporan", "", "PDF Files (*.pdf)")
+        if not file_path:
+            return
+        if self.export_thread is not None:
+            QMessageBox.warning(self, "Peringatan", "Ekspor lain sedang berjalan")
+            return
+        
+        from gantt_core import compute_report
+        from gantt_charts import capture_view, render_report
+        self.ensure_canvases()
+        
+        # Semua analisis dihitung dari satu TaskTable lalu ditulis ke satu PDF
+        load_table = self.task_table_loader(task_col, start_col, end_col, progress_col)
+        top_n = self.top_n_spin.value()
+        view = capture_view(self.gantt_canvas.fig, self.gantt_canvas.ax)
+        
+        def render(path, report_progress):
+            report_progress(0, 1, "menghitung analisis")
+            render_report(compute_report(load_table(), top_n), path, view=view,
+                          progress=report_progress)
+        
+        self.run_export(render, file_path, "Laporan", "laporan")
+    
+    def start_export(self, snapshot, file_path, label, error_label=None):
+        """Render snapshot grafik ke file di thread background (dpi 300)"""
+        if snapshot is None:
+            QMessageBox.warning(self, "Peringatan", "Tidak ada grafik yang bisa diekspor")
+            return
+        if self.export_thread is not None:
+            QMessageBox.warning(self, "Peringatan", "Ekspor lain sedang berjalan")
+            return
+        
+        from gantt_charts import render_figure
+        
+        draw, result, view = snapshot
+        
+        def render(path, report_progress):
+            report_progress(0, 1, "merender")
+            render_figure(draw, result, path, dpi=300, view=view, bbox_inches='tight')
+            report_progress(1, 1, "selesai")
+        
+        self.run_export(render, file_path, label, error_label or label)
+    
+    def run_export(self, render, file_path, label, error_label):
+        """Jalankan render(file_path, report_progress) di thread ekspor"""
+        self.export_labels = (label, error_label)
+        self.export_operation = self.begin_operation("Ekspor", f"{label}: {os.path.basename(file_path)}")
+        self.export_thread = QThread(self)
+        self.export_worker = ExportWorker(render, file_path, self.export_operation)
+        self.export_worker.moveToThread(self.export_thread)
+        
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.failed.connect(self.on_export_failed)
+        
+        self.export_progress_bar.setRange(0, 0)
+        self.export_progress_bar.setVisible(True)
+        self.statusBar().showMessage(f"Mengekspor {label} ke {os.path.basename(file_path)}...")
+        self.export_thread.start()
+    
+    def on_export_progress(self, done, total, message):
+        """Perbarui progress bar ekspor"""
+        self.export_progress_bar.setRange(0, total)
+        self.export_progress_bar.setValue(done)
+        self.statusBar().showMessage(f"Mengekspor {self.export_labels[0]}: {message} ({done}/{total})")
+    
+    def on_export_finished(self, file_path):
+        label, _ = self.export_labels
+        self.export_operation.finish(rows=len(self.df))
+        self.finish_export()
+        self.statusBar().showMessage(f"{label} disimpan", 5000)
+        QMessageBox.information(self, "Berhasil", f"{label} disimpan ke: {file_path}")
+    
+    def on_export_failed(self, message):
+        _, error_label = self.export_labels
+        self.export_operation.finish(status='gagal')
+        self.finish_export()
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", f"Gagal menyimpan {error_label}: {message}")
+    
+    def finish_export(self):
+        """Hentikan thread ekspor dan sembunyikan progress bar"""
+        if self.export_thread is not None:
+            self.export_thread.quit()
+            self.export_thread.wait()
+            self.export_worker.deleteLater()
+            self.export_thread.deleteLater()
+        
+        self.export_thread = None
+        self.export_worker = None
+        self.export_labels = None
+        self.export_operation = None
+        self.export_progress_bar.setVisible(False)
     
     def show_about(self):
         """Tampilkan informasi tentang aplikasi"""
@@ -686,6 +1462,14 @@ class MainWindow(QMainWindow):
                          "Aplikasi ini memungkinkan pengguna untuk membuat Integrasi Gantt Chart "
                          "dan melakukan analisis data dari file CSV.\n\n"
                          "Dibuat dengan Python dan PyQt6.")
+    
+    def show_performance(self):
+        """Tampilkan jendela Performa (tanpa menahan jendela utama)"""
+        if self.perf_dialog is None:
+            self.perf_dialog = PerformanceDialog(self.perf, self)
+        self.perf_dialog.show()
+        self.perf_dialog.raise_()
+        self.perf_dialog.activateWindow()
 
 # DarkLight Mode
     def setup_themes(self):
@@ -979,87 +1763,64 @@ class MainWindow(QMainWindow):
     def toggle_theme(self):
         """Toggle antara dark dan light mode"""
         self.is_dark_mode = not self.is_dark_mode
-    
-        if self.is_dark_mode:
-            self.setStyleSheet(self.dark_style)
-            # Update matplotlib style untuk dark mode
-            plt.style.use('dark_background')
-        
-            # Update existing plots
-            self.update_plot_colors_for_dark_mode()
-        
-        else:
-            self.setStyleSheet(self.light_style)
-            # Update matplotlib style untuk light mode
-            plt.style.use('default')
+        self.setStyleSheet(self.dark_style if self.is_dark_mode else self.light_style)
+        self.apply_chart_theme()
+
+    def apply_chart_theme(self):
+        """Warnai ulang grafik yang sudah tergambar sesuai tema, tanpa menghitung ulang grafik"""
+        # Sebelum canvas dibuat cukup is_dark_mode, ensure_canvases memanggil fungsi ini lagi
+        if not hasattr(self, 'gantt_canvas'):
+            return
         
-            # Update existing plots
-            self.update_plot_colors_for_light_mode()
+        theme = 'dark' if self.is_dark_mode else 'light'
+        if self.theme_engine.theme == theme:
+            return
+        canvases = (self.gantt_canvas, self.analysis_canvas)
+        self.theme_engine.set_theme(theme, [canvas.figure for canvas in canvases])
+        
+        # Hanya canvas yang terlihat yang digambar sekarang, sisanya saat tab-nya dibuka
+        for canvas in canvases:
+            if canvas.isVisible():
+                canvas.draw_idle()
+            else:
+                self.stale_canvases.add(canvas)
     
-    # Refresh canvas jika ada data
-        if self.df is not None:
-            try:
-                # Refresh Gantt chart jika sedang ditampilkan
-                if self.tab_widget.currentIndex() == 1:
-                    self.update_gantt_chart()
-                
-                # Refresh analysis jika sedang ditampilkan
-                elif self.tab_widget.currentIndex() == 2:
-                    self.update_analysis()
-            except:
-                pass
-
-    def update_plot_colors_for_dark_mode(self):
-        """Update warna plot untuk dark mode"""
-        # Update Gantt canvas
-        if hasattr(self, 'gantt_canvas'):
-            self.gantt_canvas.fig.patch.set_facecolor('#2b2b2b')
-            if hasattr(self.gantt_canvas, 'ax') and self.gantt_canvas.ax:
-                self.gantt_canvas.ax.set_facecolor('#3c3c3c')
-                self.gantt_canvas.ax.tick_params(colors='white')
-                self.gantt_canvas.ax.xaxis.label.set_color('white')
-                self.gantt_canvas.ax.yaxis.label.set_color('white')
-                self.gantt_canvas.ax.title.set_color('white')
-        
-        # Update Analysis canvas
-        if hasattr(self, 'analysis_canvas'):
-            self.analysis_canvas.fig.patch.set_facecolor('#2b2b2b')
-            if hasattr(self.analysis_canvas, 'ax') and self.analysis_canvas.ax:
-                self.analysis_canvas.ax.set_facecolor('#3c3c3c')
-                self.analysis_canvas.ax.tick_params(colors='white')
-                self.analysis_canvas.ax.xaxis.label.set_color('white')
-                self.analysis_canvas.ax.yaxis.label.set_color('white')
-                self.analysis_canvas.ax.title.set_color('white')
-
-    def update_plot_colors_for_light_mode(self):
-        """Update warna plot untuk light mode"""
-        # Update Gantt canvas
-        if hasattr(self, 'gantt_canvas'):
-            self.gantt_canvas.fig.patch.set_facecolor('white')
-            if hasattr(self.gantt_canvas, 'ax') and self.gantt_canvas.ax:
-                self.gantt_canvas.ax.set_facecolor('white')
-                self.gantt_canvas.ax.tick_params(colors='black')
-                self.gantt_canvas.ax.xaxis.label.set_color('black')
-                self.gantt_canvas.ax.yaxis.label.set_color('black')
-                self.gantt_canvas.ax.title.set_color('black')
-        
-        # Update Analysis canvas
-        if hasattr(self, 'analysis_canvas'):
-            self.analysis_canvas.fig.patch.set_facecolor('white')
-            if hasattr(self.analysis_canvas, 'ax') and self.analysis_canvas.ax:
-                self.analysis_canvas.ax.set_facecolor('white')
-                self.analysis_canvas.ax.tick_params(colors='black')
-                self.analysis_canvas.ax.xaxis.label.set_color('black')
-                self.analysis_canvas.ax.yaxis.label.set_color('black')
-                self.analysis_canvas.ax.title.set_color('black')
+    def draw_stale_canvases(self, index):
+        """Gambar canvas yang warnanya berubah selama tab-nya tersembunyi"""
+        for canvas in list(self.stale_canvases):
+            if canvas.isVisible():
+                self.stale_canvases.discard(canvas)
+                # Digambar langsung agar tab tidak sempat tampil dengan warna lama
+                canvas.draw()
         
 
 def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    window.start_warmup()
     sys.exit(app.exec())
 
 
+def batch_main(argv=None):
+    """Mode baris perintah tanpa GUI: render grafik untuk banyak CSV (lihat gantt_batch.py)"""
+    from gantt_batch import main as run_batch
+    sys.exit(run_batch(argv))
+
+
+def perf_report_main(argv=None):
+    """Ringkas log performa tanpa GUI (lihat gantt_perf_report.py)"""
+    from gantt_perf_report import main as run_report
+    sys.exit(run_report(argv))
+
+
 if __name__ == "__main__":
+    # Diperlukan agar process pool mode batch berjalan di build executable
+    multiprocessing.freeze_support()
+    # Di build executable: pakai cache font dan style bawaan bundle (sebelum matplotlib diimpor)
+    configure_matplotlib()
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        batch_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == '--perf-report':
+        perf_report_main(sys.argv[2:])
     main()
\ No newline at end of file
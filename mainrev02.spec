@@ -1,38 +1,113 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
 
+sys.path.insert(0, SPECPATH)
+from gantt_mplconfig import MPL_CONFIG_DIR, build_mpl_config
+
+# GANTT_ONEDIR=1 menghasilkan bundle one-dir: startup lebih cepat karena tidak ada ekstraksi
+# ke folder temp setiap kali aplikasi dijalankan
+ONEDIR = os.environ.get('GANTT_ONEDIR') == '1'
+
+# Modul yang tidak pernah dimuat mainrev02 saat runtime, diperiksa dengan
+# `python build_profile.py --app mainrev02 --modules` di folder ProjectApp (GUI, ekspor
+# PNG/PDF/SVG/EPS, PDF multi-halaman, laporan PDF, log performa, --batch, --perf-report).
+# PyQt5/PySide, lxml dan scipy ditambahkan manual untuk lingkungan build yang memasangnya.
+# Sengaja tetap disertakan: unittest (diimpor pyparsing untuk mathtext matplotlib),
+# pyarrow (cache CSV), numpy.core (pickle lama) dan multiprocessing/concurrent (mode batch).
+excludes = [
+    'PyQt5', 'PySide2', 'PySide6',
+    'PyQt6.QtBluetooth', 'PyQt6.QtDBus', 'PyQt6.QtDesigner', 'PyQt6.QtHelp',
+    'PyQt6.QtMultimedia', 'PyQt6.QtMultimediaWidgets', 'PyQt6.QtNetwork', 'PyQt6.QtNfc',
+    'PyQt6.QtOpenGL', 'PyQt6.QtOpenGLWidgets', 'PyQt6.QtPdf', 'PyQt6.QtPdfWidgets',
+    'PyQt6.QtPositioning', 'PyQt6.QtPrintSupport', 'PyQt6.QtQml', 'PyQt6.QtQuick',
+    'PyQt6.QtQuick3D', 'PyQt6.QtQuickWidgets', 'PyQt6.QtRemoteObjects', 'PyQt6.QtSensors',
+    'PyQt6.QtSerialPort', 'PyQt6.QtSpatialAudio', 'PyQt6.QtSql', 'PyQt6.QtStateMachine',
+    'PyQt6.QtSvgWidgets', 'PyQt6.QtTest', 'PyQt6.QtTextToSpeech', 'PyQt6.QtWebChannel',
+    'PyQt6.QtWebSockets', 'PyQt6.QtXml', 'PyQt6.lupdate', 'PyQt6.uic',
+    'matplotlib.backends._backend_gtk', 'matplotlib.backends._backend_tk',
+    'matplotlib.backends._tkagg', 'matplotlib.backends.backend_cairo',
+    'matplotlib.backends.backend_gtk3', 'matplotlib.backends.backend_gtk3agg',
+    'matplotlib.backends.backend_gtk3cairo', 'matplotlib.backends.backend_gtk4',
+    'matplotlib.backends.backend_gtk4agg', 'matplotlib.backends.backend_gtk4cairo',
+    'matplotlib.backends.backend_macosx', 'matplotlib.backends.backend_nbagg',
+    'matplotlib.backends.backend_pgf', 'matplotlib.backends.backend_qt5cairo',
+    'matplotlib.backends.backend_qtcairo', 'matplotlib.backends.backend_template',
+    'matplotlib.backends.backend_tkagg', 'matplotlib.backends.backend_tkcairo',
+    'matplotlib.backends.backend_webagg', 'matplotlib.backends.backend_webagg_core',
+    'matplotlib.backends.backend_wx', 'matplotlib.backends.backend_wxagg',
+    'matplotlib.backends.backend_wxcairo', 'matplotlib.sphinxext', 'matplotlib.testing',
+    'matplotlib.tests', 'numpy.conftest', 'numpy.distutils', 'numpy.f2py', 'numpy.tests',
+    'pandas.conftest', 'pandas.tests',
+    'tkinter', 'doctest', 'pydoc', 'pydoc_data', 'test', 'lib2to3', 'distutils',
+    'xmlrpc', 'sqlite3', 'curses', 'idlelib', 'turtle', 'turtledemo', 'ensurepip', 'venv',
+    'IPython', 'jedi', 'parso', 'prompt_toolkit', 'pygments', 'traitlets', 'lxml', 'scipy',
+    'pytest', 'setuptools', 'pkg_resources', 'pip',
+]
+
+# Cache font dan style tema matplotlib, dibundel ke folder mpl_config
+mpl_config = build_mpl_config(os.path.join(SPECPATH, 'build', MPL_CONFIG_DIR))
 
 a = Analysis(
     ['mainrev02.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=['xml', 'xml.etree.ElementTree', 'lxml.etree', 'PyQt6.QtWidgets', 'PyQt6.QtCore', 'PyQt6.QtGui'],
+    datas=[(mpl_config, MPL_CONFIG_DIR)],
+    hiddenimports=['PyQt6.QtWidgets', 'PyQt6.QtCore', 'PyQt6.QtGui'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=['PyQt5'],
+    excludes=excludes,
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='mainrev02',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='mainrev02',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        name='mainrev02',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='mainrev02',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
@@ -1,5 +1,21 @@
-from cx_Freeze import setup, Executable
+from cx_Freeze import setup, Executable, build_exe
+import os
 import sys
+from gantt_mplconfig import MPL_CONFIG_DIR, build_mpl_config
+from gantt_perf import APP_VERSION
+
+# Cache font dan style tema matplotlib dibuat saat build, lalu disalin ke folder mpl_config
+# di samping executable agar grafik pertama tidak menunggu cache font dibangun ulang
+mpl_config_build_dir = os.path.join('build', MPL_CONFIG_DIR)
+
+
+class BuildExeWithMplConfig(build_exe):
+    """build_exe yang membuat folder mpl_config sebelum include_files disalin"""
+
+    def run(self):
+        build_mpl_config(mpl_config_build_dir)
+        super().run()
+
 
 # Dependensi yang perlu disertakan
 build_exe_options = {
@@ -20,11 +36,11 @@ build_exe_options = {
         "numpy"
     ],
     "include_files": [
+        (mpl_config_build_dir, MPL_CONFIG_DIR),
         # Tambahkan file tambahan jika ada (icon, dll)
     ],
     "excludes": [
         "tkinter",  # Tidak diperlukan untuk PyQt6
-        "unittest",
         "pydoc_data"
     ]
 }
@@ -36,9 +52,10 @@ if sys.platform == "win32":
 
 setup(
     name="Gantt Chart Analyzer",
-    version="1.0",
+    version=APP_VERSION,
     description="Aplikasi Integrasi Gantt Chart dan Analisis Data",
     options={"build_exe": build_exe_options},
+    cmdclass={"build_exe": BuildExeWithMplConfig},
     executables=[Executable(
         "mainrev02.py",
         base=base,